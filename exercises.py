@@ -47,6 +47,17 @@ def entrypoint_regexp_perf():
     re.match(importlib_metadata.EntryPoint.pattern, input)
 
 
+def entrypoint_parse_perf():
+    import contextlib
+
+    import importlib_metadata
+
+    input = '0' + ' ' * 2**10 + '0'  # end warmup
+
+    with contextlib.suppress(ValueError):
+        importlib_metadata.EntryPoint(name='sample', value=input, group='sample')
+
+
 def normalize_perf():
     # python/cpython#143658
     import importlib_metadata  # end warmup
@@ -57,3 +68,136 @@ def normalize_perf():
 def import_time():
     "import"
     import importlib_metadata  # noqa: F401
+
+
+def metadata_json_perf():
+    "metadata json"
+    import importlib_metadata
+
+    classifiers = ''.join(f'Classifier: Topic :: Sample :: {n}\n' for n in range(300))
+    text = f'Name: sample\nVersion: 1.0\n{classifiers}\nDescription\n'
+
+    class Dist(importlib_metadata.Distribution):
+        def read_text(self, filename):
+            return text if filename == 'METADATA' else None
+
+        def locate_file(self, path):
+            raise NotImplementedError()
+
+    md = Dist().metadata  # end warmup
+
+    md.json
+
+
+def folded_case_perf():
+    "FoldedCase keys"
+    from importlib_metadata import _adapters, _text
+
+    keys = [f'Header-{n % 50}' for n in range(2_000)]
+    multiple_use = _adapters.Message.multiple_use_keys  # end warmup
+
+    for key in keys:
+        folded = _text.FoldedCase(key)
+        folded in multiple_use
+        folded == 'classifier'
+
+
+def entry_points_parse_perf():
+    "entry points parse"
+    import importlib_metadata
+
+    plugins = ''.join(f'plugin{n} = sample.plugins.p{n}:Plugin\n' for n in range(8))
+    corpus = (
+        '[console_scripts]\n'
+        'sample = sample.cli:main\n'
+        'sample-admin = sample.admin:run [admin]\n'
+        '\n'
+        '# plugins shipped with the package\n'
+        f'[sample.plugins]\n{plugins}'
+        '\n'
+        '[pytest11]\n'
+        'sample = sample.testing.plugin\n'
+    )
+    texts = [corpus.replace('sample', f'pkg{n}') for n in range(200)]
+
+    class Dist(importlib_metadata.Distribution):
+        def __init__(self, text):
+            self.text = text
+
+        def read_text(self, filename):
+            return self.text if filename == 'entry_points.txt' else None
+
+        def locate_file(self, path):
+            raise NotImplementedError()
+
+    dists = list(map(Dist, texts))  # end warmup
+
+    for dist in dists:
+        dist.entry_points
+
+
+def requires_parse_perf():
+    "requires.txt parse"
+    import importlib_metadata
+
+    reqs = ''.join(f'dep{n}>=1.{n}\n' for n in range(10))
+    extras = ''.join(f'\n[extra{n}:python_version < "3.12"]\n{reqs}' for n in range(10))
+    texts = {'METADATA': 'Name: sample\nVersion: 1.0\n', 'requires.txt': reqs + extras}
+
+    class Dist(importlib_metadata.Distribution):
+        def read_text(self, filename):
+            return texts.get(filename)
+
+        def locate_file(self, path):
+            raise NotImplementedError()
+
+    dist = Dist()  # end warmup
+
+    for _ in range(100):
+        dist.requires
+
+
+def record_parse_perf():
+    "RECORD parse"
+    import importlib_metadata
+
+    rows = (
+        f'pkg/sub{n // 100}/module_{n}.py,sha256=abcdefghijklmnopqrstuvwxyz0123456789ABCDEFG,{n}\n'
+        for n in range(50_000)
+    )
+    text = ''.join(rows)
+
+    class Located:
+        def exists(self):
+            return True
+
+    class Dist(importlib_metadata.Distribution):
+        def read_text(self, filename):
+            return text if filename == 'RECORD' else None
+
+        def locate_file(self, path):
+            return Located()
+
+    dist = Dist()  # end warmup
+
+    dist.files
+
+
+def installed_files_perf():
+    "installed-files.txt"
+    import pathlib
+    import tempfile
+
+    import importlib_metadata
+
+    names = (f'../sample/sub{n // 50}/module_{n}.py\n' for n in range(5_000))
+    text = ''.join(names) + 'PKG-INFO\nSOURCES.txt\n'
+
+    class Dist(importlib_metadata.PathDistribution):
+        def read_text(self, filename):
+            return text if filename == 'installed-files.txt' else None
+
+    site = pathlib.Path(tempfile.gettempdir(), 'installed-files-perf')
+    dist = Dist(site / 'sample-1.0.egg-info')  # end warmup
+
+    dist.files
@@ -10,8 +10,9 @@ for more detail.
 from __future__ import annotations
 
 import abc
+import array
 import collections
-import email
+import collections.abc
 import functools
 import itertools
 import operator
@@ -21,13 +22,13 @@ import posixpath
 import re
 import sys
 import textwrap
+import time
 import types
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import suppress
 from importlib import import_module
 from importlib.abc import MetaPathFinder
-from itertools import starmap
-from typing import Any
+from typing import Any, NamedTuple, overload
 
 from . import _meta
 from ._collections import FreezableDefaultDict, Pair
@@ -35,6 +36,7 @@ from ._compat import (
     NullFinder,
     install,
 )
+from ._concurrent import map_ordered
 from ._context import ExceptionTrap
 from ._functools import method_cache, noop, pass_none, passthrough
 from ._itertools import always_iterable, bucket, unique_everseen
@@ -50,9 +52,12 @@ __all__ = [
     'MetadataNotFound',
     'SimplePath',
     'distribution',
+    'distribution_for_file',
     'distributions',
+    'distributions_for_package',
     'entry_points',
     'files',
+    'installed_sizes',
     'metadata',
     'packages_distributions',
     'requires',
@@ -125,13 +130,43 @@ class Sectioned:
             if section.name is not None
         )
 
+    @staticmethod
+    def entries(text, section=None):
+        """
+        Yield (section, name, value) for each entry, or only for those
+        in ``section`` if indicated, in a single pass over the text.
+
+        >>> list(Sectioned.entries(Sectioned._sample))
+        [('sec1', 'a', '1'), ('sec1', 'b', '2'), ('sec2', 'a', '2')]
+        >>> list(Sectioned.entries(Sectioned._sample, 'sec2'))
+        [('sec2', 'a', '2')]
+        """
+        if section is not None and f'[{section}]' not in text:
+            return
+        name = None
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue
+            if line[0] == '[' and line[-1] == ']':
+                name = line.strip('[]')
+                continue
+            if name is None or (section is not None and name != section):
+                continue
+            key, sep, value = line.partition('=')
+            if not sep:
+                # TypeError, as raised by section_pairs
+                raise TypeError(f'Expected "name = value", got {line!r}')
+            yield name, key.rstrip(), value.lstrip()
+
     @staticmethod
     def read(text, filter_=None):
-        lines = filter(filter_, map(str.strip, text.splitlines()))
         name = None
-        for value in lines:
-            section_match = value.startswith('[') and value.endswith(']')
-            if section_match:
+        for line in text.splitlines():
+            value = line.strip()
+            if not value or (filter_ is not None and not filter_(value)):
+                continue
+            if value[0] == '[' and value[-1] == ']':
                 name = value.strip('[]')
                 continue
             yield Pair(name, value)
@@ -145,6 +180,56 @@ class _EntryPointMatch(types.SimpleNamespace):
     module: str
     attr: str
     extras: str
+    names: list[str]
+
+    @classmethod
+    def scan(cls, value: str) -> _EntryPointMatch | None:
+        """
+        Parse value in a single pass, as for ``EntryPoint.pattern``,
+        or return None if it's invalid.
+
+        >>> _EntryPointMatch.scan('pkg.mod : obj.attr [a, b] ')
+        _EntryPointMatch(module='pkg.mod', attr='obj.attr', extras='[a, b]', names=['a', 'b'])
+        >>> _EntryPointMatch.scan('pkg.mod:')
+        """
+        # '[' may appear only to begin the extras and ':' only to
+        # begin the attr, so the first of each delimits the parts.
+        body, bracket, extras = value.partition('[')
+        module, colon, attr = body.partition(':')
+        module = module.rstrip()
+        if not cls._is_dotted(module):
+            return None
+        if colon:
+            attr = attr.strip()
+            if not cls._is_dotted(attr):
+                return None
+        if bracket:
+            extras = (bracket + extras).rstrip()
+            if len(extras) < 2 or extras[-1] != ']' or '\n' in extras:
+                return None
+        return cls(
+            module=module,
+            attr=attr if colon else None,
+            extras=extras if bracket else None,
+            names=cls._words(extras) if bracket else [],
+        )
+
+    @staticmethod
+    def _is_dotted(text: str) -> bool:
+        """
+        Does text match ``[\\w.]+``?
+        """
+        remainder = text.replace('.', '').replace('_', '')
+        return bool(text) and (not remainder or remainder.isalnum())
+
+    @staticmethod
+    def _words(text: str) -> list[str]:
+        """
+        Equivalent to ``re.findall(r'\\w+', text)``.
+        """
+        return ''.join(
+            char if char.isalnum() or char == '_' else ' ' for char in text
+        ).split()
 
 
 class EntryPoint:
@@ -186,6 +271,16 @@ class EntryPoint:
     ...
     ValueError: ('Invalid object reference...invalid-name...
 
+    Entry points loaded from distribution metadata defer validation
+    until the value is first used, as most are never loaded.
+
+    >>> ep = EntryPoint._lazy(name=None, group=None, value='invalid-name')
+    >>> ep.load()
+    Traceback (most recent call last):
+    ...
+    ValueError: ('Invalid object reference...invalid-name...
+
+    Use ``EntryPoints.validate`` to validate them eagerly.
     """
 
     pattern = re.compile(
@@ -194,7 +289,8 @@ class EntryPoint:
         r'((?P<extras>\[.*\])\s*)?$'
     )
     """
-    A regular expression describing the syntax for an entry point,
+    A regular expression describing the syntax for an entry point
+    (values are parsed by an equivalent linear-time scanner),
     which might look like:
 
         - module
@@ -213,12 +309,42 @@ class EntryPoint:
     value: str
     group: str
 
-    dist: Distribution | None = None
+    dist: Distribution | None
+
+    _parsed: _EntryPointMatch
+    _hash: int
+
+    __slots__ = ('name', 'value', 'group', 'dist', '_parsed', '_hash')
 
     def __init__(self, name: str, value: str, group: str) -> None:
-        vars(self).update(name=name, value=value, group=group)
+        self._assign(name=name, value=value, group=group)
         self.module
 
+    @classmethod
+    def _lazy(cls, name: str, value: str, group: str) -> EntryPoint:
+        """
+        Construct an EntryPoint without validating the value.
+        """
+        ep = cls.__new__(cls)
+        ep._assign(name=name, value=value, group=group)
+        return ep
+
+    def _assign(self, name, value, group, dist=None):
+        """
+        Set the (otherwise immutable) attributes.
+
+        Groups are interned, as they are shared by many entry points,
+        and the hash is computed once.
+        """
+        if isinstance(group, str):
+            group = sys.intern(group)
+        set_ = functools.partial(object.__setattr__, self)
+        set_('name', name)
+        set_('value', value)
+        set_('group', group)
+        set_('dist', dist)
+        set_('_hash', hash((name, value, group)))
+
     def load(self) -> Any:
         """Load the entry point from its definition. If only a module
         is indicated by the value, return that module. Otherwise,
@@ -238,11 +364,18 @@ class EntryPoint:
 
     @property
     def extras(self) -> list[str]:
-        return re.findall(r'\w+', self._match.extras or '')
+        return list(self._match.names)
 
-    @functools.cached_property
+    @property
     def _match(self) -> _EntryPointMatch:
-        match = self.pattern.match(self.value)
+        try:
+            return self._parsed
+        except AttributeError:
+            object.__setattr__(self, '_parsed', self._parse())
+        return self._parsed
+
+    def _parse(self) -> _EntryPointMatch:
+        match = _EntryPointMatch.scan(self.value)
         if not match:
             raise ValueError(
                 'Invalid object reference. '
@@ -250,10 +383,10 @@ class EntryPoint:
                 '/en/latest/specifications/entry-points/#data-model',
                 self.value,
             )
-        return _EntryPointMatch(**match.groupdict())
+        return match
 
     def _for(self, dist):
-        vars(self).update(dist=dist)
+        object.__setattr__(self, 'dist', dist)
         return self
 
     def matches(self, **params):
@@ -303,11 +436,27 @@ class EntryPoint:
         return self._key() < other._key()
 
     def __eq__(self, other):
-        return self._key() == other._key()
+        return (
+            self.value == other.value
+            and self.name == other.name
+            and self.group == other.group
+        )
 
     def __setattr__(self, name, value):
         raise AttributeError("EntryPoint objects are immutable.")
 
+    def __getstate__(self):
+        return dict(name=self.name, value=self.value, group=self.group, dist=self.dist)
+
+    def __setstate__(self, state):
+        # state pickled by earlier versions may hold other attributes
+        self._assign(
+            name=state['name'],
+            value=state['value'],
+            group=state['group'],
+            dist=state.get('dist'),
+        )
+
     def __repr__(self):
         return (
             f'EntryPoint(name={self.name!r}, value={self.value!r}, '
@@ -315,23 +464,59 @@ class EntryPoint:
         )
 
     def __hash__(self) -> int:
-        return hash(self._key())
+        return self._hash
+
+
+class LoadResult(NamedTuple):
+    """
+    The outcome of loading one entry point in ``EntryPoints.load_all``.
+    """
+
+    entry_point: EntryPoint
+    value: Any
+    """The loaded object, or None if loading failed."""
+    error: Exception | None
+    """The exception raised while loading, if any."""
+    elapsed: float
+    """Wall time in seconds spent loading."""
+    modules: int
+    """The number of modules newly added to ``sys.modules``."""
 
 
 class EntryPoints(tuple):
     """
     An immutable collection of selectable EntryPoint objects.
+
+    Selection by group and/or name is resolved through indexes built
+    on first use.
+
+    >>> eps = EntryPoints(EntryPoints._from_text(EntryPoints._sample))
+    >>> eps.select(group='console_scripts').names == {'main', 'alt'}
+    True
+    >>> eps.select(group='console_scripts', name='alt')['alt'].value
+    'pkg.cli:alt'
+    >>> eps['other'].group
+    'pkg.plugins'
     """
 
-    __slots__ = ()
+    _sample = textwrap.dedent(
+        """
+        [console_scripts]
+        main = pkg.cli:main
+        alt = pkg.cli:alt
+
+        [pkg.plugins]
+        other = pkg.other
+        """
+    ).lstrip()
 
     def __getitem__(self, name: str) -> EntryPoint:  # type: ignore[override] # Work with str instead of int
         """
         Get the EntryPoint in self matching name.
         """
         try:
-            return next(iter(self.select(name=name)))
-        except StopIteration:
+            return self._by_name[name][0]
+        except KeyError:
             raise KeyError(name)
 
     def __repr__(self):
@@ -341,39 +526,268 @@ class EntryPoints(tuple):
         """
         return f'{self.__class__.__name__}({tuple(self)!r})'
 
+    def __setattr__(self, name, value):
+        # the indexes are held in __dict__ (by cached_property) instead
+        raise AttributeError("EntryPoints objects are immutable.")
+
     def select(self, **params) -> EntryPoints:
         """
         Select entry points from self that match the
         given parameters (typically group and/or name).
         """
+        if params and params.keys() <= {'group', 'name'}:
+            with suppress(TypeError):  # unhashable parameter
+                return EntryPoints(self._lookup(**params))
         return EntryPoints(ep for ep in self if ep.matches(**params))
 
+    def _lookup(self, **params) -> Iterable[EntryPoint]:
+        """
+        Resolve a selection by group and/or name from the indexes.
+        """
+        if 'group' not in params:
+            return self._by_name.get(params['name'], ())
+        found = self._by_group.get(params['group'], ())
+        if 'name' not in params:
+            return found
+        return (ep for ep in found if params['name'] == ep.name)
+
+    @functools.cached_property
+    def _by_group(self) -> dict[str, list[EntryPoint]]:
+        return self._index(operator.attrgetter('group'))
+
+    @functools.cached_property
+    def _by_name(self) -> dict[str, list[EntryPoint]]:
+        return self._index(operator.attrgetter('name'))
+
+    def _index(self, key) -> dict[str, list[EntryPoint]]:
+        index = collections.defaultdict(list)
+        for ep in self:
+            index[key(ep)].append(ep)
+        return dict(index)
+
+    def load_all(
+        self, *, collect_errors: bool = False, by_package: bool = False
+    ) -> list[LoadResult]:
+        """
+        Load each entry point in self, reporting for each the time
+        taken and the number of modules imported.
+
+        If ``collect_errors`` is False, the first failure is raised;
+        otherwise it is recorded in the result and loading continues.
+
+        If ``by_package`` is True, entry points are loaded grouped by
+        their top-level package, so the cost of importing a shared
+        package is borne by the first of its entry points and the
+        remainder reflect only their own imports. Results are always
+        reported in the order of self.
+
+        >>> eps = EntryPoints([
+        ...     EntryPoint('join', 'os.path:join', 'demo'),
+        ...     EntryPoint('nope', 'os.path:nope', 'demo'),
+        ... ])
+        >>> ok, failed = eps.load_all(collect_errors=True)
+        >>> ok.value is os.path.join, ok.error
+        (True, None)
+        >>> type(failed.error)
+        <class 'AttributeError'>
+        """
+        order = list(enumerate(self))
+        if by_package:
+            order.sort(key=lambda item: _top_level(item[1]))
+        results = {index: _load_timed(ep, collect_errors) for index, ep in order}
+        return [results[index] for index in range(len(self))]
+
+    def validate(self) -> EntryPoints:
+        """
+        Validate each entry point in self, as on construction, raising
+        ValueError for the first that is invalid. Return self.
+
+        Entry points loaded from metadata are otherwise validated only
+        when first used, so tools that lint them should call this.
+
+        >>> bad = EntryPoint._lazy(name='bad', value='invalid-name', group='demo')
+        >>> EntryPoints([bad]).validate()
+        Traceback (most recent call last):
+        ...
+        ValueError: ('Invalid object reference...invalid-name...
+        """
+        for ep in self:
+            ep._match
+        return self
+
     @property
     def names(self) -> set[str]:
         """
         Return the set of all names of all entry points.
         """
-        return {ep.name for ep in self}
+        return set(self._by_name)
 
     @property
     def groups(self) -> set[str]:
         """
         Return the set of all groups of all entry points.
         """
-        return {ep.group for ep in self}
+        return set(self._by_group)
 
     @classmethod
-    def _from_text_for(cls, text, dist):
-        return cls(ep._for(dist) for ep in cls._from_text(text))
+    def _from_text_for(cls, text, dist, group=None):
+        return cls(ep._for(dist) for ep in cls._from_text(text, group))
 
     @staticmethod
-    def _from_text(text):
+    def _from_text(text, group=None):
         return (
-            EntryPoint(name=item.value.name, value=item.value.value, group=item.name)
-            for item in Sectioned.section_pairs(text or '')
+            EntryPoint._lazy(name=name, value=value, group=section)
+            for section, name, value in Sectioned.entries(text or '', group)
         )
 
 
+def _top_level(ep: EntryPoint) -> str:
+    """
+    The top-level package named by the entry point's value, without
+    requiring the value to be valid.
+    """
+    return ep.value.partition(':')[0].strip().partition('.')[0]
+
+
+def _load_timed(ep: EntryPoint, collect_errors: bool) -> LoadResult:
+    before = len(sys.modules)
+    start = time.perf_counter()
+    value, error = None, None
+    try:
+        value = ep.load()
+    except Exception as exc:
+        if not collect_errors:
+            raise
+        error = exc
+    elapsed = time.perf_counter() - start
+    return LoadResult(ep, value, error, elapsed, len(sys.modules) - before)
+
+
+def _record_rows(lines: Iterable[str]) -> Iterator[list[str]]:
+    """
+    Parse lines of CSV as found in RECORD, taking a fast path for
+    lines without quotes, or that are simply quoted, and relying on
+    ``csv`` for the others.
+
+    >>> list(_record_rows(['a.py,sha256=x,1', '"b,c.py"', '"d""e.py",,', '']))
+    [['a.py', 'sha256=x', '1'], ['b,c.py'], ['d"e.py', '', ''], []]
+    >>> list(_record_rows(['"multi', 'line.py",,', 'f.py']))
+    [['multiline.py', '', ''], ['f.py']]
+    """
+    lines = iter(lines)
+    for line in lines:
+        if '"' not in line and line:
+            yield line.split(',')
+        elif len(line) > 1 and line[0] == '"' == line[-1] and '"' not in line[1:-1]:
+            yield [line[1:-1]]
+        else:
+            # Delay csv import, since Distribution.files is not as widely
+            # used as other parts of importlib.metadata
+            import csv
+
+            # reads only the lines of this row from the shared iterator
+            yield next(csv.reader(itertools.chain([line], lines)))
+
+
+def _resolve_all(base: pathlib.Path, names: Iterable[str]) -> Iterator[str]:
+    """
+    Resolve each of names relative to base, as ``(base / name).resolve()``
+    would, but resolving each directory only once and listing it to
+    detect symlinked files.
+
+    Leading ``..`` components are applied lexically to the resolved
+    base. Names with other ``..`` components are resolved in full.
+    """
+    start = os.path.realpath(base)
+    dirs: dict[str, tuple[str, set[str]]] = {}
+    for name in names:
+        parts = name.replace(os.altsep or os.sep, os.sep).split(os.sep)
+        leading = next(
+            (index for index, part in enumerate(parts) if part != '..'), len(parts)
+        )
+        if '..' in parts[leading:]:
+            yield os.path.realpath(os.path.join(base, name))
+            continue
+        parent, leaf = os.path.split(os.path.normpath(os.path.join(start, name)))
+        if parent not in dirs:
+            real = os.path.realpath(parent)
+            dirs[parent] = real, _symlinks(real)
+        real, links = dirs[parent]
+        located = os.path.join(real, leaf)
+        yield os.path.realpath(located) if leaf in links else located
+
+
+def _symlinks(directory: str) -> set[str]:
+    """
+    The names of the symlinks in directory.
+    """
+    with suppress(OSError):
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_symlink()}
+    return set()
+
+
+def _file_size(located) -> int:
+    """
+    The size of the file at located (a path or SimplePath), or 0 if
+    it can't be read.
+    """
+    with suppress(OSError):
+        if isinstance(located, (str, os.PathLike)):
+            return os.stat(located).st_size
+        return len(located.read_bytes())
+    return 0
+
+
+def _existing(table: FileTable) -> list[PackagePath]:
+    """
+    The files in table that exist, listing each directory on the
+    file system once rather than checking each file.
+
+    Names not found in the listing (possibly differing only in case)
+    and symlinks are checked individually.
+    """
+    base = _local_root(table.dist)
+    if base is None:
+        return [path for path in table[:] if path.locate().exists()]
+    listings: dict[str, set[str] | None] = {}
+
+    def exists(index: int) -> bool:
+        located = os.path.join(base, table.path(index))
+        parent, name = os.path.split(located)
+        if parent not in listings:
+            listings[parent] = _listing(parent)
+        names = listings[parent]
+        return names is not None and (name in names or os.path.exists(located))
+
+    return table._make_all(filter(exists, range(len(table))))
+
+
+def _local_root(dist: Distribution) -> str | None:
+    """
+    The directory against which a PathDistribution on the file system
+    locates its files, or None for other distributions.
+    """
+    path = getattr(dist, '_path', None)
+    if getattr(type(dist), 'locate_file', None) is not PathDistribution.locate_file:
+        return None
+    return os.fspath(path.parent) if isinstance(path, pathlib.Path) else None
+
+
+def _listing(directory: str) -> set[str] | None:
+    """
+    The names of the entries (other than symlinks) in directory, or
+    None if it does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if not entry.is_symlink()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return set()
+
+
 class PackagePath(pathlib.PurePosixPath):
     """A reference to a path in a package"""
 
@@ -391,6 +805,14 @@ class PackagePath(pathlib.PurePosixPath):
         """Return a path-like object for this path"""
         return self.dist.locate_file(self)
 
+    @classmethod
+    def _make(cls, name: str, hash: str | None, size: int | None, dist) -> PackagePath:
+        result = cls(name)
+        result.hash = FileHash(hash) if hash else None
+        result.size = size  # type: ignore[assignment]
+        result.dist = dist
+        return result
+
 
 class FileHash:
     def __init__(self, spec: str) -> None:
@@ -400,6 +822,95 @@ class FileHash:
         return f'<FileHash mode: {self.mode} value: {self.value}>'
 
 
+class FileTable(collections.abc.Sequence):
+    """
+    The files listed by a distribution, held in columns.
+
+    Directory prefixes are shared, sizes are packed (with -1 for no
+    size) and hashes are kept as the raw ``mode=value`` strings.
+    ``PackagePath`` objects are created only as items are accessed.
+
+    >>> table = FileTable.from_rows(
+    ...     [['pkg/__init__.py', 'sha256=abc', '3'], ['pkg/mod.py']], dist=None)
+    >>> table.paths()
+    ['pkg/__init__.py', 'pkg/mod.py']
+    >>> table[0].hash.value, table[0].size
+    ('abc', 3)
+    >>> table[1].hash, table[1].size
+    (None, None)
+    """
+
+    def __init__(self, dist: Distribution) -> None:
+        self.dist = dist
+        self.dirs: list[str] = []
+        self.dir_indexes = array.array('I')
+        self.names: list[str] = []
+        self.hashes: list[str | None] = []
+        self.sizes = array.array('q')
+        self._dir_lookup: dict[str, int] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[str]], dist) -> FileTable:
+        table = cls(dist)
+        append = table.append
+        for row in rows:
+            append(*row)
+        return table
+
+    def append(self, name: str, hash: str | None = None, size_str: str | None = None):
+        head, sep, base = name.rpartition('/')
+        prefix = head + sep
+        index = self._dir_lookup.get(prefix)
+        if index is None:
+            index = self._dir_lookup[prefix] = len(self.dirs)
+            self.dirs.append(prefix)
+        self.dir_indexes.append(index)
+        self.names.append(base)
+        self.hashes.append(hash or None)
+        self.sizes.append(int(size_str) if size_str else -1)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def path(self, index: int) -> str:
+        """
+        The path of the file at index as listed.
+        """
+        return self.dirs[self.dir_indexes[index]] + self.names[index]
+
+    def paths(self) -> list[str]:
+        return list(map(self.path, range(len(self))))
+
+    @overload
+    def __getitem__(self, index: int) -> PackagePath: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[PackagePath]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._make_all(range(len(self))[index])
+        return self._make(range(len(self))[index])
+
+    def _make(self, index: int) -> PackagePath:
+        (path,) = self._make_all((index,))
+        return path
+
+    def _make_all(self, indexes: Iterable[int]) -> list[PackagePath]:
+        dirs, dir_indexes, names = self.dirs, self.dir_indexes, self.names
+        hashes, sizes, dist = self.hashes, self.sizes, self.dist
+        result = []
+        for index in indexes:
+            path = PackagePath(dirs[dir_indexes[index]] + names[index])
+            hash = hashes[index]
+            size = sizes[index]
+            path.hash = FileHash(hash) if hash else None
+            path.size = None if size < 0 else size  # type: ignore[assignment]
+            path.dist = dist
+            result.append(path)
+        return result
+
+
 class Distribution(metaclass=abc.ABCMeta):
     """
     An abstract Python distribution package.
@@ -434,6 +945,19 @@ class Distribution(metaclass=abc.ABCMeta):
         :return: The text if found, otherwise None.
         """
 
+    def read_bytes(self, filename) -> bytes | None:
+        """Attempt to load metadata file given by the name as bytes.
+
+        Used where a file can be parsed without first decoding all of
+        it (currently the metadata). The default implementation encodes
+        the result of ``read_text``; providers with access to the raw
+        bytes may override this method to avoid that round trip.
+
+        :param filename: The name of the file in the distribution info.
+        :return: The UTF-8 encoded content if found, otherwise None.
+        """
+        return pass_none(str.encode)(self.read_text(filename), 'utf-8')
+
     @abc.abstractmethod
     def locate_file(self, path: str | os.PathLike[str]) -> SimplePath:
         """
@@ -536,26 +1060,26 @@ class Distribution(metaclass=abc.ABCMeta):
         :raises MetadataNotFound: If no metadata file is present.
         """
 
-        text = (
-            self.read_text('METADATA')
-            or self.read_text('PKG-INFO')
+        data = (
+            self.read_bytes('METADATA')
+            or self.read_bytes('PKG-INFO')
             # This last clause is here to support old egg-info files.  Its
             # effect is to just end up using the PathDistribution's self._path
             # (which points to the egg-info file) attribute unchanged.
-            or self.read_text('')
+            or self.read_bytes('')
         )
-        return self._assemble_message(self._ensure_metadata_present(text))
+        return self._assemble_message(self._ensure_metadata_present(data))
 
     @staticmethod
-    def _assemble_message(text: str) -> _meta.PackageMetadata:
+    def _assemble_message(data: bytes) -> _meta.PackageMetadata:
         # deferred for performance (python/cpython#109829)
         from . import _adapters
 
-        return _adapters.Message(email.message_from_string(text))
+        return _adapters.Message.from_bytes(data)
 
-    def _ensure_metadata_present(self, text: str | None) -> str:
-        if text is not None:
-            return text
+    def _ensure_metadata_present(self, data: bytes | None) -> bytes:
+        if data is not None:
+            return data
 
         raise MetadataNotFound('No package metadata was found.')
 
@@ -584,6 +1108,21 @@ class Distribution(metaclass=abc.ABCMeta):
         """
         return EntryPoints._from_text_for(self.read_text('entry_points.txt'), self)
 
+    def _entry_points_in(self, group: str | None) -> EntryPoints:
+        """
+        Return EntryPoints for this distribution, parsing only those
+        in ``group`` (if indicated).
+
+        Providers overriding ``entry_points`` are honored, selecting
+        from all they supply.
+        """
+        if group is None:
+            return self.entry_points
+        if type(self).entry_points is not Distribution.entry_points:
+            return self.entry_points.select(group=group)
+        text = self.read_text('entry_points.txt')
+        return EntryPoints._from_text_for(text, self, group)
+
     @property
     def files(self) -> list[PackagePath] | None:
         """Files in this distribution.
@@ -599,33 +1138,120 @@ class Distribution(metaclass=abc.ABCMeta):
         ``read_text``) or override this property to allow for callers to be
         able to resolve filenames provided by the package.
         """
+        return self._files()
 
-        def make_file(name, hash=None, size_str=None):
-            result = PackagePath(name)
-            result.hash = FileHash(hash) if hash else None
-            result.size = int(size_str) if size_str else None
-            result.dist = self
-            return result
+    def _files(self, check_exists: bool = True) -> list[PackagePath] | None:
+        """
+        Files in this distribution, including those listed but not
+        present unless ``check_exists``.
+        """
+        table = self.file_table
+        if table is None:
+            return None
+        return _existing(table) if check_exists else table[:]
+
+    @property
+    def file_table(self) -> FileTable | None:
+        """
+        The files listed by this distribution (present or not), as
+        a ``FileTable``, or None as for ``files``.
+        """
 
         @pass_none
-        def make_files(lines):
-            # Delay csv import, since Distribution.files is not as widely used
-            # as other parts of importlib.metadata
-            import csv
+        def make_table(lines):
+            return FileTable.from_rows(_record_rows(lines), self)
 
-            return starmap(make_file, csv.reader(lines))
+        return make_table(
+            self._read_files_distinfo()
+            or self._read_files_egginfo_installed()
+            or self._read_files_egginfo_sources()
+        )
 
-        @pass_none
-        def skip_missing_files(package_paths):
-            return list(filter(lambda path: path.locate().exists(), package_paths))
-
-        return skip_missing_files(
-            make_files(
-                self._read_files_distinfo()
-                or self._read_files_egginfo_installed()
-                or self._read_files_egginfo_sources()
+    def installed_size(self) -> int | None:
+        """
+        The total size in bytes of the files of this distribution.
+
+        Sizes are taken from the file listing (i.e. RECORD). Only
+        files without a recorded size are checked on the file system,
+        and those missing count as empty.
+
+        :return: The size, or None if the distribution has no file
+            listing (as for ``files``).
+        """
+        if type(self).files is not Distribution.files:
+            listed = self.files
+            if listed is None:
+                return None
+            return sum(
+                _file_size(path.locate()) if path.size is None else path.size
+                for path in listed
             )
+        table = self.file_table
+        if table is None:
+            return None
+        recorded = sum(size for size in table.sizes if size >= 0)
+        unknown = (index for index, size in enumerate(table.sizes) if size < 0)
+        base = _local_root(self)
+        located: Iterable[SimplePath | str]
+        if base is None:
+            located = (table[index].locate() for index in unknown)
+        else:
+            located = (os.path.join(base, table.path(index)) for index in unknown)
+        return recorded + sum(map(_file_size, located))
+
+    def verify(self, max_workers: int | None = None, progress=None) -> list:
+        """
+        Check the files of this distribution against the sizes and
+        hashes recorded for them.
+
+        :param max_workers: The number of threads hashing files.
+        :param progress: Called with the number of files checked and
+            the number listed so far as each completes.
+        :return: A list of ``verify.Problem`` for the files that are
+            missing or don't match, ordered by path.
+        """
+        # Delay import, as verification is rarely needed
+        from .verify import verify_distribution
+
+        return verify_distribution(self, max_workers, progress)
+
+    def iter_files(
+        self,
+        suffix: str | tuple[str, ...] | None = None,
+        top_level: str | None = None,
+    ) -> Iterator[PackagePath]:
+        """
+        Yield the files listed by this distribution (present or not)
+        as the listing is parsed, so a consumer may stop early.
+
+        :param suffix: Yield only files whose names end with this
+            suffix (or any of these suffixes).
+        :param top_level: Yield only files under this top-level
+            directory.
+        """
+        prefix = top_level and top_level.rstrip('/') + '/'
+
+        def wanted(name: str) -> bool:
+            return (suffix is None or name.endswith(suffix)) and (
+                not prefix or name.startswith(prefix)
+            )
+
+        if type(self).files is not Distribution.files:
+            yield from (path for path in self.files or () if wanted(path.as_posix()))
+            return
+
+        rows = _record_rows(
+            self._read_files_distinfo()
+            or self._read_files_egginfo_installed()
+            or self._read_files_egginfo_sources()
+            or ()
         )
+        for row in rows:
+            if wanted(row[0]):
+                yield self._make_file(*row)
+
+    def _make_file(self, name, hash=None, size_str=None) -> PackagePath:
+        return PackagePath._make(name, hash, int(size_str) if size_str else None, self)
 
     def _read_files_distinfo(self):
         """
@@ -653,13 +1279,20 @@ class Distribution(metaclass=abc.ABCMeta):
         if not text or not subdir:
             return
 
-        paths = (
-            py311
-            .relative_fix((subdir / name).resolve())
-            .relative_to(self.locate_file('').resolve(), walk_up=True)
-            .as_posix()
-            for name in text.splitlines()
-        )
+        if isinstance(subdir, pathlib.Path):
+            root = os.path.realpath(self.locate_file(''))
+            paths = (
+                pathlib.PurePath(os.path.relpath(resolved, root)).as_posix()
+                for resolved in _resolve_all(subdir, text.splitlines())
+            )
+        else:
+            paths = (
+                py311
+                .relative_fix((subdir / name).resolve())
+                .relative_to(self.locate_file('').resolve(), walk_up=True)
+                .as_posix()
+                for name in text.splitlines()
+            )
         return map('"{}"'.format, paths)
 
     def _read_files_egginfo_sources(self):
@@ -725,9 +1358,12 @@ class Distribution(metaclass=abc.ABCMeta):
             # '@' is uniquely indicative of a url_req.
             return ' ' * ('@' in req)
 
+        markers = {}
         for section in sections:
+            if section.name not in markers:
+                markers[section.name] = quoted_marker(section.name)
             space = url_req_space(section.value)
-            yield section.value + space + quoted_marker(section.name)
+            yield section.value + space + markers[section.name]
 
     @property
     def origin(self):
@@ -1018,6 +1654,11 @@ class MetadataPathFinder(NullFinder, DistributionFinder):
     @classmethod
     def invalidate_caches(cls) -> None:
         FastPath.__new__.cache_clear()
+        _entry_points.cache_clear()
+        _files_index.cache_clear()
+        _packages.cache_clear()
+        _package_owners.cache_clear()
+        _dist_packages.cache_clear()
 
 
 class PathDistribution(Distribution):
@@ -1042,6 +1683,23 @@ class PathDistribution(Distribution):
 
     read_text.__doc__ = Distribution.read_text.__doc__
 
+    def read_bytes(self, filename: str | os.PathLike[str]) -> bytes | None:
+        if type(self).read_text is not PathDistribution.read_text:
+            # honor subclasses supplying their own text
+            return super().read_bytes(filename)
+        with suppress(
+            FileNotFoundError,
+            IsADirectoryError,
+            KeyError,
+            NotADirectoryError,
+            PermissionError,
+        ):
+            return self._path.joinpath(filename).read_bytes()
+
+        return None
+
+    read_bytes.__doc__ = Distribution.read_bytes.__doc__
+
     def locate_file(self, path: str | os.PathLike[str]) -> SimplePath:
         return self._path.parent / path
 
@@ -1121,6 +1779,104 @@ Wrapper for ``distributions`` to return unique distributions by name.
 """
 
 
+class _EnvironmentCache(dict):
+    """
+    Values derived from the installed distributions, retained only
+    while the environment is unchanged.
+
+    The environment is identified by the finders on ``sys.meta_path``
+    and the entries on ``sys.path`` with the modification time of
+    each, which changes as distributions are installed or removed. Changes
+    within a metadata directory are not detected; call
+    ``importlib.invalidate_caches()`` after such changes.
+    """
+
+    fingerprint = None
+
+    def get_or_compute(self, key, compute):
+        fingerprint = self._fingerprint()
+        if fingerprint != self.fingerprint:
+            self.cache_clear()
+            self.fingerprint = fingerprint
+        try:
+            return self[key]
+        except KeyError:
+            return self.setdefault(key, compute())
+
+    def cache_clear(self):
+        self.clear()
+        self.fingerprint = None
+
+    @staticmethod
+    def _fingerprint():
+        paths = tuple(sys.path)
+        return tuple(sys.meta_path), paths, tuple(map(_mtime, paths))
+
+
+def _mtime(path):
+    with suppress(OSError, TypeError):
+        return os.stat(path or '.').st_mtime_ns
+
+
+def _metadata_dir(dist: Distribution) -> pathlib.Path | None:
+    """
+    The metadata directory of a plain PathDistribution on the file
+    system, or None for other distributions.
+    """
+    path = getattr(dist, '_path', None)
+    if type(dist) is PathDistribution and isinstance(path, pathlib.Path):
+        return path
+    return None
+
+
+def _metadata_stamp(path: pathlib.Path) -> int | None:
+    """
+    The modification time of the RECORD in a metadata directory (or
+    of the directory itself if there is no RECORD), which changes
+    when the distribution is reinstalled.
+    """
+    stamp = _mtime(path / 'RECORD')
+    return _mtime(path) if stamp is None else stamp
+
+
+class _DistributionCache(dict):
+    """
+    Values derived from individual distributions on the file system,
+    retained while each distribution's ``_metadata_stamp`` is
+    unchanged.
+    """
+
+    def get_or_compute(self, dist: Distribution, compute):
+        path = _metadata_dir(dist)
+        if path is None:
+            return compute(dist)
+        stamp = _metadata_stamp(path)
+        with suppress(KeyError):
+            cached_stamp, value = self[path]
+            if cached_stamp == stamp:
+                return value
+        value = self[path] = stamp, compute(dist)
+        return value[1]
+
+    def prune(self, dists: Iterable[Distribution]) -> None:
+        """
+        Discard the values for distributions other than dists, such
+        as those since uninstalled or upgraded.
+        """
+        for path in self.keys() - set(map(_metadata_dir, dists)):
+            del self[path]
+
+    def cache_clear(self):
+        self.clear()
+
+
+_entry_points = _clear_after_fork(_EnvironmentCache())
+"""
+EntryPoints for all installed packages, keyed by the group parsed
+(or ``None`` for all groups).
+"""
+
+
 def entry_points(**params) -> EntryPoints:
     """Return EntryPoint objects for all installed packages.
 
@@ -1128,21 +1884,113 @@ def entry_points(**params) -> EntryPoints:
     result to entry points matching those properties (see
     EntryPoints.select()).
 
+    The entry points are retained until the environment changes, so
+    repeated calls return the same (immutable) object.
+
     :return: EntryPoints for all installed packages.
     """
+    group = params.get('group')
+    # parse only the selected group, when a group name is given
+    if not isinstance(group, str):
+        group = None
+    eps = _entry_points.get_or_compute(
+        group, functools.partial(_load_entry_points, group)
+    )
+    if group is not None:
+        del params['group']
+    return eps.select(**params) if params else eps
+
+
+def _load_entry_points(group: str | None) -> EntryPoints:
+    # Delay import, as the registry is optional and it depends on
+    # this module
+    from .registry import Registries
+
+    registries = Registries()
     eps = itertools.chain.from_iterable(
-        dist.entry_points for dist in _unique(distributions())
+        registries.entry_points(dist, group) for dist in _unique(distributions())
     )
-    return EntryPoints(eps).select(**params)
+    return EntryPoints(eps)
 
 
-def files(distribution_name: str) -> list[PackagePath] | None:
+def files(
+    distribution_name: str, check_exists: bool = True
+) -> list[PackagePath] | None:
     """Return a list of files for the named package.
 
     :param distribution_name: The name of the distribution package to query.
+    :param check_exists: If False, include files listed by the package
+        but not present, and avoid checking for each file.
     :return: List of files composing the distribution.
     """
-    return distribution(distribution_name).files
+    dist = distribution(distribution_name)
+    if check_exists or type(dist).files is not Distribution.files:
+        return dist.files
+    return dist._files(check_exists=False)
+
+
+def distribution_for_file(path: str | os.PathLike[str]) -> Distribution | None:
+    """
+    Return the installed distribution that lists the file at
+    ``path`` (such as a module's ``__file__``), or None.
+
+    Files are matched by absolute location (without resolving
+    symlinks) against an index of the files of all distributions,
+    retained until the environment changes.
+
+    :param path: The path to a file, absolute or relative to the
+        current directory.
+    :return: The Distribution listing the file, or None.
+    """
+    index = _files_index.get_or_compute(None, _build_files_index)
+    return index.get(_file_key(path))
+
+
+_files_index = _clear_after_fork(_EnvironmentCache())
+"""
+The distribution listing each file, keyed (only) by ``None``.
+"""
+
+
+def _build_files_index() -> dict[str, Distribution]:
+    index: dict[str, Distribution] = {}
+    for dist in _unique(distributions()):
+        for location in _file_locations(dist):
+            index.setdefault(_file_key(location), dist)
+    return index
+
+
+def _file_key(path: str | os.PathLike[str]) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _file_locations(dist: Distribution) -> Iterable[str]:
+    """
+    The locations of the files listed by dist, present or not.
+    """
+    if type(dist).files is not Distribution.files:
+        return (str(path.locate()) for path in dist.files or ())
+    table = dist.file_table
+    if table is None:
+        return ()
+    base = _local_root(dist)
+    if base is None:
+        return (str(path.locate()) for path in table)
+    return (os.path.join(base, path) for path in table.paths())
+
+
+def installed_sizes(max_workers: int | None = 1) -> dict[str, int | None]:
+    """
+    Return the installed size in bytes of each distribution, by
+    name (see ``Distribution.installed_size``).
+
+    :param max_workers: The number of threads among which to divide
+        the distributions, or None for a default based on the number
+        of processors.
+    """
+    dists = list(_unique(distributions()))
+    sizes = map_ordered(operator.methodcaller('installed_size'), dists, max_workers)
+    return {dist.name: size for dist, size in zip(dists, sizes)}
 
 
 def requires(distribution_name: str) -> list[str] | None:
@@ -1155,7 +2003,7 @@ def requires(distribution_name: str) -> list[str] | None:
     return distribution(distribution_name).requires
 
 
-def packages_distributions() -> Mapping[str, list[str]]:
+def packages_distributions(max_workers: int | None = 1) -> Mapping[str, list[str]]:
     """
     Return a mapping of top-level packages to their
     distributions.
@@ -1164,14 +2012,111 @@ def packages_distributions() -> Mapping[str, list[str]]:
     >>> pkgs = packages_distributions()
     >>> all(isinstance(dist, collections.abc.Sequence) for dist in pkgs.values())
     True
+
+    :param max_workers: The number of threads among which to divide
+        the distributions when the mapping is computed, or None for
+        a default based on the number of processors. The result is
+        the same (and in the same order) regardless.
     """
+    mapping = _packages.get_or_compute(
+        None, functools.partial(_build_packages_distributions, max_workers)
+    )
+    return {pkg: list(names) for pkg, names in mapping.items()}
+
+
+_packages = _clear_after_fork(_EnvironmentCache())
+"""
+The mapping of ``packages_distributions``, keyed (only) by ``None``.
+"""
+
+_dist_packages = _clear_after_fork(_DistributionCache())
+"""
+The name and top-level packages of each distribution, retained
+across changes to the environment, so only distributions added or
+changed are read again.
+"""
+
+
+def _build_packages_distributions(max_workers: int | None) -> dict[str, list[str]]:
+    def name_and_packages(dist):
+        return _dist_packages.get_or_compute(dist, _name_and_packages)
+
+    dists = list(distributions())
+    results = map_ordered(name_and_packages, dists, max_workers)
+    _dist_packages.prune(dists)
     pkg_to_dist = collections.defaultdict(list)
-    for dist in distributions():
-        for pkg in _top_level_declared(dist) or _top_level_inferred(dist):
-            pkg_to_dist[pkg].append(dist.metadata['Name'])
+    for name, pkgs in results:
+        for pkg in pkgs:
+            pkg_to_dist[pkg].append(name)
     return dict(pkg_to_dist)
 
 
+def _name_and_packages(dist: Distribution) -> tuple[str, list[str]]:
+    pkgs = _top_level_declared(dist) or _top_level_inferred(dist)
+    return dist.metadata['Name'], list(pkgs)
+
+
+def distributions_for_package(name: str) -> list[str]:
+    """
+    Return the names of the distributions providing the top-level
+    package (or module) ``name``, as ``packages_distributions()[name]``
+    would, or an empty list.
+
+    Distributions declaring their top-level packages (in
+    ``top_level.txt``) are consulted first. Only then are the files of
+    the others searched, stopping at the first match in each. The
+    result is retained until the environment changes.
+    """
+    owners = _package_owners.get_or_compute(name, functools.partial(_owners, name))
+    return list(owners)
+
+
+_package_owners = _clear_after_fork(_EnvironmentCache())
+"""
+The result of ``distributions_for_package``, keyed by package name.
+"""
+
+
+def _owners(name: str) -> list[str]:
+    found = []
+    undeclared = []
+    for index, dist in enumerate(distributions()):
+        declared = _top_level_declared(dist)
+        if not declared:
+            undeclared.append((index, dist))
+        elif name in declared:
+            found.append((index, dist))
+    found.extend(
+        (index, dist) for index, dist in undeclared if _provides_inferred(dist, name)
+    )
+    return [
+        dist.metadata['Name']
+        for index, dist in sorted(found, key=operator.itemgetter(0))
+    ]
+
+
+def _provides_inferred(dist: Distribution, name: str) -> bool:
+    """
+    Does dist include an existing file inferred to provide the
+    top-level name (as for ``_top_level_inferred``)?
+    """
+    if '.' in name:
+        return False
+    if type(dist).files is not Distribution.files:
+        candidates: Iterable[PackagePath] = dist.files or ()
+    else:
+        table = dist.file_table
+        if table is None:
+            return False
+        candidates = (
+            table[index] for index in range(len(table)) if name in table.path(index)
+        )
+    return any(
+        _get_toplevel_name(path) == name and path.locate().exists()
+        for path in candidates
+    )
+
+
 def _top_level_declared(dist):
     return (dist.read_text('top_level.txt') or '').split()
 
@@ -75,6 +75,29 @@ class Message(email.message.Message):
     Keys that may be indicated multiple times per PEP 566.
     """
 
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        r"""
+        Parse metadata from the UTF-8 bytes of a metadata file.
+
+        Only the headers are fed through the email parser. The body,
+        frequently the bulk of the file, is attached as decoded.
+
+        >>> msg = Message.from_bytes(b'Name: Foo\r\nVersion: 3.0\r\n\r\nBody\r\n')
+        >>> msg['Version'], msg['Description']
+        ('3.0', 'Body\n')
+        """
+        # mimic universal newlines as applied by read_text
+        text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        head, sep, body = text.partition('\n\n')
+        msg = email.message_from_string(head + sep[:1])
+        if msg.get_payload():
+            # the parser found the body elsewhere; defer to it
+            msg = email.message_from_string(text)
+        else:
+            msg.set_payload(body)
+        return cls(msg)
+
     def __new__(cls, orig: email.message.Message):
         res = super().__new__(cls)
         vars(res).update(vars(orig))
@@ -102,6 +125,41 @@ class Message(email.message.Message):
             raise KeyError(item)
         return res
 
+    def get(self, name, failobj=None):
+        values = self._index.get(name.lower())
+        return failobj if values is None else values[0]
+
+    def get_all(self, name, failobj=None):
+        values = self._index.get(name.lower())
+        return failobj if values is None else list(values)
+
+    def __contains__(self, name):
+        return name.lower() in self._index
+
+    @property
+    def _index(self):
+        """
+        Header values keyed by case-folded name, in order of appearance.
+
+        Built once per message (and rebuilt only if the headers are
+        altered), so lookups don't scan every header. Metadata with
+        hundreds of ``Classifier`` lines made ``json`` quadratic otherwise.
+        """
+        headers = self._headers
+        cached = vars(self).get('_index_cache')
+        if cached and cached[0] is headers and cached[1] == len(headers):
+            return cached[2]
+        index = {}
+        fetch = self.policy.header_fetch_parse
+        for key, value in headers:
+            index.setdefault(key.lower(), []).append(fetch(key, value))
+        vars(self)['_index_cache'] = headers, len(headers), index
+        return index
+
+    def replace_header(self, _name, _value):
+        super().replace_header(_name, _value)
+        vars(self).pop('_index_cache', None)
+
     def _repair_headers(self):
         def redent(value):
             "Correct for RFC822 indentation"
@@ -126,11 +184,11 @@ class Message(email.message.Message):
         per PEP 0566.
         """
 
-        def transform(key):
-            value = self.get_all(key) if key in self.multiple_use_keys else self[key]
-            if key == 'Keywords':
+        def transform(item):
+            key, values = item
+            value = list(values) if key in self.multiple_use_keys else values[0]
+            if key == 'keywords':
                 value = re.split(r'\s+', value)
-            tk = key.lower().replace('-', '_')
-            return tk, value
+            return key.replace('-', '_'), value
 
-        return dict(map(transform, map(FoldedCase, self)))
+        return dict(map(transform, self._index.items()))
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import concurrent.futures
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+
+def map_ordered(
+    func: Callable[[_T], _R], items: Iterable[_T], max_workers: int | None = 1
+) -> list[_R]:
+    """
+    Apply func to each of items, in a pool of threads unless
+    ``max_workers`` is 1, returning the results in the order of items.
+
+    >>> map_ordered(len, ['a', 'bb', 'ccc'], max_workers=2)
+    [1, 2, 3]
+    """
+    if max_workers == 1:
+        return list(map(func, items))
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import json
+import os
+from contextlib import suppress
+
+
+def write_json(file: str | os.PathLike[str], data) -> None:
+    """
+    Write data to file as JSON, so readers never see a partial file.
+    """
+    temp = f'{os.fspath(file)}.{os.getpid()}.tmp'
+    try:
+        with open(temp, 'w', encoding='utf-8') as strm:
+            json.dump(data, strm, separators=(',', ':'))
+        os.replace(temp, file)
+    finally:
+        with suppress(FileNotFoundError):
+            os.remove(temp)
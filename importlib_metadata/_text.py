@@ -1,6 +1,17 @@
+import functools
 import re
 
-from ._functools import method_cache
+
+@functools.lru_cache(maxsize=1024)
+def _fold(value):
+    """
+    Return the case-folded form of value.
+
+    Shared by all ``FoldedCase`` instances, so a given key is lowered
+    (and the result shared) while it remains in the cache, rather than
+    once per instance.
+    """
+    return value.lower()
 
 
 # from jaraco.text 3.5
@@ -64,6 +75,11 @@ class FoldedCase(str):
     False
     """
 
+    def __new__(cls, value=''):
+        self = super().__new__(cls, value)
+        self._folded = _fold(str(self))
+        return self
+
     def __lt__(self, other):
         return self.lower() < other.lower()
 
@@ -77,19 +93,18 @@ class FoldedCase(str):
         return self.lower() != other.lower()
 
     def __hash__(self):
-        return hash(self.lower())
+        return hash(self._folded)
 
     def __contains__(self, other):
-        return super().lower().__contains__(other.lower())
+        return self._folded.__contains__(other.lower())
 
     def in_(self, other):
         "Does self appear in other?"
         return self in FoldedCase(other)
 
-    # cache lower since it's likely to be called frequently.
-    @method_cache
+    # folded value is computed on construction (see _fold).
     def lower(self):
-        return super().lower()
+        return self._folded
 
     def index(self, sub):
         return self.lower().index(sub.lower())
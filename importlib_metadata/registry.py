@@ -0,0 +1,108 @@
+"""
+An optional registry of the entry points of the distributions in a
+site directory, so ``entry_points()`` reads one file per directory
+instead of one per distribution.
+
+Write (or refresh) the registry after installing packages:
+
+    >>> from importlib_metadata import registry
+    >>> registry.save(site_dir)  # doctest: +SKIP
+
+Each distribution in the registry is stamped with the modification
+time of its ``entry_points.txt``. A distribution whose stamp no
+longer matches, or that is missing from the registry, has its entry
+points read from its metadata as usual, as do all distributions in
+a site directory whose registry is unreadable or malformed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+
+from . import Distribution, EntryPoints, _metadata_dir, _mtime
+from ._persist import write_json
+
+__all__ = ['NAME', 'save']
+
+NAME = 'entry_points.registry.json'
+"""
+The name of the registry file in a site directory.
+"""
+
+_FORMAT = 1
+
+_FILE = 'entry_points.txt'
+
+
+def save(site_dir: str | os.PathLike[str]) -> None:
+    """
+    Write the registry for the distributions in ``site_dir``.
+    """
+    root = pathlib.Path(site_dir)
+    dists = {}
+    for dist in Distribution.discover(path=[str(root)]):
+        path = _metadata_dir(dist)
+        if path is None or path.parent != root:
+            continue
+        # stamp first, so a concurrent change leaves the entry stale
+        stamp = _mtime(path / _FILE)
+        dists[path.name] = dict(stamp=stamp, text=dist.read_text(_FILE))
+    write_json(root / NAME, dict(format=_FORMAT, distributions=dists))
+
+
+def _load(root: pathlib.Path) -> dict:
+    """
+    The registered distributions in root, or none if the registry is
+    missing, unreadable or malformed.
+    """
+    try:
+        with open(root / NAME, encoding='utf-8') as strm:
+            data = json.load(strm)
+    except (OSError, ValueError):
+        return {}
+    return data['distributions'] if _valid(data) else {}
+
+
+def _valid(data) -> bool:
+    """
+    Is data of the shape written by ``save``?
+    """
+    return (
+        isinstance(data, dict)
+        and data.get('format') == _FORMAT
+        and isinstance(data.get('distributions'), dict)
+        and all(
+            isinstance(entry, dict)
+            and isinstance(entry.get('stamp'), (int, type(None)))
+            and isinstance(entry.get('text'), (str, type(None)))
+            and entry.keys() >= {'stamp', 'text'}
+            for entry in data['distributions'].values()
+        )
+    )
+
+
+class Registries:
+    """
+    The registries of site directories, loaded as distributions in
+    each are encountered.
+    """
+
+    def __init__(self) -> None:
+        self.roots: dict[pathlib.Path, dict] = {}
+
+    def entry_points(self, dist: Distribution, group: str | None) -> EntryPoints:
+        """
+        The entry points of ``dist`` (in ``group`` if indicated), from
+        the registry if current for it, or else from its metadata.
+        """
+        path = _metadata_dir(dist)
+        if path is None:
+            return dist._entry_points_in(group)
+        if path.parent not in self.roots:
+            self.roots[path.parent] = _load(path.parent)
+        entry = self.roots[path.parent].get(path.name)
+        if entry is None or entry['stamp'] != _mtime(path / _FILE):
+            return dist._entry_points_in(group)
+        return EntryPoints._from_text_for(entry['text'], dist, group)
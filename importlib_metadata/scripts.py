@@ -0,0 +1,139 @@
+"""
+Resolve console and GUI scripts from a precomputed table.
+
+Resolving a script through ``entry_points()`` parses the entry points
+of every distribution in the environment. Instead, keep a table of
+scripts in a file and answer from it:
+
+    >>> from importlib_metadata import scripts
+    >>> ep = scripts.resolve('pip', cache='scripts.json')  # doctest: +SKIP
+    >>> ep.load()()  # doctest: +SKIP
+
+The table records the modification time of each entry on the search
+path and is rebuilt (and saved again) when any of them change, as
+they do when distributions are installed or removed. Changes within
+an existing metadata directory are not detected; call ``save`` to
+rebuild the table after such changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sys
+from collections.abc import Iterable
+from contextlib import suppress
+
+from . import (
+    EntryPoint,
+    PathDistribution,
+    _mtime,
+    _unique,
+    distributions,
+)
+from ._persist import write_json
+
+__all__ = ['resolve', 'save']
+
+_FORMAT = 1
+
+_groups = ('console_scripts', 'gui_scripts')
+
+
+def save(cache: str | os.PathLike[str], path: Iterable[str] | None = None) -> dict:
+    """
+    Build the table of scripts for the distributions on ``path``
+    (default ``sys.path``) and write it to ``cache``.
+
+    Failure to write the table is ignored.
+    """
+    table = _build(list(sys.path if path is None else path))
+    with suppress(OSError):
+        write_json(cache, table)
+    return table
+
+
+def resolve(
+    name: str,
+    cache: str | os.PathLike[str],
+    group: str = 'console_scripts',
+    path: Iterable[str] | None = None,
+) -> EntryPoint | None:
+    """
+    Return the entry point for the script ``name`` in ``group``, or
+    None if no distribution on ``path`` (default ``sys.path``)
+    supplies it.
+
+    Where more than one distribution supplies the script, the first
+    found wins, as for ``entry_points()``.
+    """
+    path = list(sys.path if path is None else path)
+    table = _load(cache, path) or save(cache, path)
+    spec = table['groups'].get(group, {}).get(name)
+    return spec and _entry_point(name, group, *spec)
+
+
+def _stamps(path: list[str]) -> list:
+    return [[item, _mtime(item)] for item in path]
+
+
+def _build(path: list[str]) -> dict:
+    groups: dict[str, dict] = {group: {} for group in _groups}
+    for dist in _unique(distributions(path=path)):
+        location = _location(dist)
+        for ep in dist.entry_points:
+            if ep.group in groups:
+                groups[ep.group].setdefault(ep.name, [ep.value, location])
+    return dict(format=_FORMAT, stamps=_stamps(path), groups=groups)
+
+
+def _location(dist) -> str | None:
+    """
+    The location of a file system distribution, from which it can
+    be recreated cheaply.
+    """
+    path = getattr(dist, '_path', None)
+    if isinstance(dist, PathDistribution) and isinstance(path, pathlib.Path):
+        return str(path)
+    return None
+
+
+def _load(cache: str | os.PathLike[str], path: list[str]) -> dict | None:
+    """
+    Load the table from cache, or None if it's missing, unreadable,
+    malformed or stale for path.
+    """
+    try:
+        with open(cache, encoding='utf-8') as strm:
+            table = json.load(strm)
+    except (OSError, ValueError):
+        return None
+    if not _valid(table) or table['stamps'] != _stamps(path):
+        return None
+    return table
+
+
+def _valid(table) -> bool:
+    """
+    Is table of the shape written by ``save``?
+    """
+    return (
+        isinstance(table, dict)
+        and table.get('format') == _FORMAT
+        and isinstance(table.get('groups'), dict)
+        and all(
+            isinstance(found, dict)
+            and all(
+                isinstance(spec, list) and len(spec) == 2 for spec in found.values()
+            )
+            for found in table['groups'].values()
+        )
+    )
+
+
+def _entry_point(name, group, value, location) -> EntryPoint:
+    ep = EntryPoint._lazy(name=name, value=value, group=group)
+    if location is None:
+        return ep
+    return ep._for(PathDistribution(pathlib.Path(location)))
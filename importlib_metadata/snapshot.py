@@ -0,0 +1,180 @@
+"""
+Capture the distributions of an environment to a file and serve
+them back later without scanning the file system.
+
+Save a snapshot of the current environment:
+
+    >>> from importlib_metadata import snapshot
+    >>> snapshot.save('env.json')  # doctest: +SKIP
+
+Load it (typically in another process) and give it primacy for
+discovery:
+
+    >>> import sys
+    >>> finder = snapshot.load('env.json')  # doctest: +SKIP
+    >>> sys.meta_path.insert(0, finder)  # doctest: +SKIP
+
+The snapshot records the metadata files of each distribution
+(``METADATA``, ``entry_points.txt``, ``requires.txt`` and so on)
+along with a ``RECORD`` of the files that were present, so names,
+versions, entry points, requirements and file lists are all
+answered from the snapshot.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import pathlib
+from collections.abc import Iterable
+
+from . import (
+    Distribution,
+    DistributionFinder,
+    MetadataNotFound,
+    Prepared,
+    distributions,
+)
+from ._compat import NullFinder
+from ._functools import pass_none
+
+__all__ = ['SnapshotDistribution', 'SnapshotFinder', 'load', 'save']
+
+_FORMAT = 1
+
+_captured = (
+    'entry_points.txt',
+    'requires.txt',
+    'top_level.txt',
+    'direct_url.json',
+)
+"""
+Metadata files captured verbatim, in addition to ``METADATA`` and
+``RECORD``, which are handled specially.
+"""
+
+
+def save(file: str | os.PathLike[str], dists: Iterable[Distribution] | None = None):
+    """
+    Write a snapshot of ``dists`` (default all ``distributions()``)
+    to ``file``.
+    """
+    dists = distributions() if dists is None else dists
+    data = dict(format=_FORMAT, distributions=list(map(_capture, dists)))
+    with open(file, 'w', encoding='utf-8') as strm:
+        json.dump(data, strm, separators=(',', ':'))
+
+
+def load(file: str | os.PathLike[str]) -> SnapshotFinder:
+    """
+    Load a snapshot written by ``save`` and return a finder for it.
+    """
+    with open(file, encoding='utf-8') as strm:
+        data = json.load(strm)
+    if data.get('format') != _FORMAT:
+        raise ValueError(f"Unsupported snapshot format: {data.get('format')!r}")
+    return SnapshotFinder(
+        SnapshotDistribution(**spec) for spec in data['distributions']
+    )
+
+
+def _capture(dist: Distribution) -> dict:
+    texts = {name: dist.read_text(name) for name in _captured}
+    texts.update(
+        METADATA=dist.read_text('METADATA')
+        or dist.read_text('PKG-INFO')
+        or dist.read_text(''),
+        RECORD=_record(dist.files),
+    )
+    return dict(
+        root=os.path.realpath(str(dist.locate_file(''))),
+        texts={name: text for name, text in texts.items() if text is not None},
+        normalized_name=_normalized_name(dist),
+    )
+
+
+def _normalized_name(dist: Distribution) -> str | None:
+    try:
+        return dist._normalized_name
+    except MetadataNotFound:
+        return None
+
+
+def _key(path: str | os.PathLike[str]) -> str:
+    """
+    The canonical spelling of path, for comparing search path entries.
+    """
+    return os.path.normcase(os.path.realpath(path))
+
+
+@pass_none
+def _record(files) -> str:
+    """
+    Render files (as found) in the RECORD format.
+    """
+    # Delay csv import, since Distribution.files is not as widely used
+    # as other parts of importlib.metadata
+    import csv
+
+    def row(path):
+        hash = path.hash and f'{path.hash.mode}={path.hash.value}'
+        return path.as_posix(), hash or '', '' if path.size is None else path.size
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(map(row, files))
+    return buffer.getvalue()
+
+
+class SnapshotDistribution(Distribution):
+    """
+    A distribution whose metadata files are held in memory.
+    """
+
+    def __init__(
+        self, root: str, texts: dict[str, str], normalized_name: str | None = None
+    ) -> None:
+        self._root = root
+        self._texts = texts
+        self._normalized_name_captured = normalized_name
+
+    def read_text(self, filename) -> str | None:
+        return self._texts.get(os.fspath(filename))
+
+    read_text.__doc__ = Distribution.read_text.__doc__
+
+    def locate_file(self, path: str | os.PathLike[str]) -> pathlib.Path:
+        return pathlib.Path(self._root, path)
+
+    @property
+    def _normalized_name(self):
+        """
+        Resolve the name as captured, avoiding a parse of the metadata.
+        """
+        return self._normalized_name_captured or super()._normalized_name
+
+
+class SnapshotFinder(NullFinder, DistributionFinder):
+    """
+    A finder supplying the distributions captured in a snapshot.
+
+    The search path is honored only when one is explicitly supplied
+    in the context, so a snapshot taken on one system may be served
+    on another.
+    """
+
+    def __init__(self, dists: Iterable[SnapshotDistribution]) -> None:
+        self.dists = list(dists)
+        self._keys = [_key(dist._root) for dist in self.dists]
+
+    def find_distributions(
+        self, context=DistributionFinder.Context()
+    ) -> Iterable[SnapshotDistribution]:
+        prepared = Prepared(context.name)
+        paths = set(map(_key, vars(context).get('path', ())))
+        return (
+            dist
+            for dist, key in zip(self.dists, self._keys)
+            if (not paths or key in paths)
+            and (not prepared or dist._normalized_name == prepared.normalized)
+        )
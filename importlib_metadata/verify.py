@@ -0,0 +1,170 @@
+"""
+Verify installed files against the sizes and hashes recorded for
+them (in ``RECORD``).
+
+    >>> from importlib_metadata import verify
+    >>> problems = verify.verify_environment()  # doctest: +SKIP
+
+Files are hashed in a thread pool, as hashing (and reading) releases
+the GIL. They are listed as they are checked, so only a bounded
+number are pending at any time.
+"""
+
+from __future__ import annotations
+
+import base64
+import concurrent.futures
+import hashlib
+import itertools
+import os
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple
+
+from . import Distribution, PackagePath, _local_root, _unique, distributions
+
+__all__ = ['Problem', 'verify_distribution', 'verify_environment']
+
+_CHUNK = 2**20
+
+_PENDING = 2**10
+"""
+The most checks submitted to the pool and not yet reported.
+"""
+
+
+class Problem(NamedTuple):
+    """
+    A file that does not match its record.
+    """
+
+    path: PackagePath
+    kind: str
+    """
+    One of ``missing``, ``unreadable`` (it could not be read, as for
+    lack of permission), ``size``, ``hash`` or ``unsupported`` (the
+    hash mode is not available).
+    """
+    expected: str | int | None
+    actual: str | int | None
+
+
+Progress = Callable[[int, int], object]
+"""
+Called with the number of files checked and the number listed so
+far, which is the total once every file has been listed.
+"""
+
+
+def verify_distribution(
+    dist: Distribution,
+    max_workers: int | None = None,
+    progress: Progress | None = None,
+) -> list[Problem]:
+    """
+    Return the problems with the files of ``dist``.
+    """
+    return verify_environment([dist], max_workers, progress)[dist]
+
+
+def verify_environment(
+    dists: Iterable[Distribution] | None = None,
+    max_workers: int | None = None,
+    progress: Progress | None = None,
+) -> dict[Distribution, list[Problem]]:
+    """
+    Return the problems with the files of each of ``dists``
+    (default all distributions, one per name), in the order given.
+    """
+    dists = list(_unique(distributions()) if dists is None else dists)
+    checks = _checks(dists)
+    results: dict[Distribution, list[Problem]] = {dist: [] for dist in dists}
+    pending: dict[concurrent.futures.Future, Distribution] = {}
+    checked = listed = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        while True:
+            for dist, path, location in itertools.islice(
+                checks, _PENDING - len(pending)
+            ):
+                pending[executor.submit(_check, path, location)] = dist
+                listed += 1
+            if not pending:
+                break
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                dist = pending.pop(future)
+                problem = future.result()
+                if problem:
+                    results[dist].append(problem)
+                checked += 1
+                if progress:
+                    progress(checked, listed)
+    for problems in results.values():
+        problems.sort(key=lambda problem: str(problem.path))
+    return results
+
+
+def _checks(dists: list[Distribution]) -> Iterator[tuple]:
+    """
+    Yield (dist, path, location) for each file of each of dists.
+    """
+    for dist in dists:
+        base = _local_root(dist)
+        for path in dist.iter_files():
+            yield dist, path, _location(path, base)
+
+
+def _location(path: PackagePath, base: str | None):
+    """
+    The location of path as a string, if on the file system.
+    """
+    return path.locate() if base is None else os.path.join(base, path)
+
+
+def _check(path: PackagePath, location) -> Problem | None:
+    try:
+        return _compare(path, location)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return Problem(path, 'missing', None, None)
+    except OSError:
+        return Problem(path, 'unreadable', None, None)
+
+
+def _compare(path: PackagePath, location) -> Problem | None:
+    """
+    Compare the file at location to its record, reading a file not
+    on the file system at most once.
+    """
+    data = None
+    if isinstance(location, str):
+        size = os.stat(location).st_size
+    elif not location.exists():
+        raise FileNotFoundError(location)
+    elif path.size is None and path.hash is None:
+        return None
+    else:
+        data = location.read_bytes()
+        size = len(data)
+    if path.size is not None and size != path.size:
+        return Problem(path, 'size', path.size, size)
+    if path.hash is None:
+        return None
+    try:
+        digest = hashlib.new(path.hash.mode)
+    except ValueError:
+        return Problem(path, 'unsupported', path.hash.mode, None)
+    if data is None:
+        _update(digest, location)
+    else:
+        digest.update(data)
+    actual = base64.urlsafe_b64encode(digest.digest()).rstrip(b'=').decode()
+    if actual != path.hash.value:
+        return Problem(path, 'hash', path.hash.value, actual)
+    return None
+
+
+def _update(digest, location: str) -> None:
+    with open(location, 'rb') as strm:
+        for chunk in iter(lambda: strm.read(_CHUNK), b''):
+            digest.update(chunk)
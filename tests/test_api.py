@@ -172,6 +172,26 @@ class APITests(
         md = metadata('distinfo-pkg')
         assert md.get('does-not-exist') is None
 
+    def test_get_all_any_case(self):
+        md = metadata('egginfo-pkg')
+        assert md.get_all('classifier') == md.get_all('CLASSIFIER')
+        assert len(md.get_all('Classifier')) == 2
+        assert md.get_all('does-not-exist') is None
+        assert 'classifier' in md
+
+    def test_headers_altered(self):
+        """
+        Lookups reflect headers added, removed, or replaced after load.
+        """
+        md = metadata('egginfo-pkg')
+        md['Classifier'] = 'Framework :: Pytest'
+        assert len(md.get_all('Classifier')) == 3
+        md.replace_header('Author', 'Jane Doe')
+        assert md['author'] == 'Jane Doe'
+        del md['Classifier']
+        assert 'Classifier' not in md
+        assert 'classifier' not in md.json
+
     @staticmethod
     def _test_files(files):
         root = files[0].root
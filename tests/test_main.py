@@ -1,6 +1,14 @@
+import copyreg
+import csv
 import importlib
+import os
+import pathlib
 import pickle
+import random
 import re
+import shutil
+import sys
+import types
 import unittest
 
 import pyfakefs.fake_filesystem_unittest as ffs
@@ -9,12 +17,18 @@ from test.support import os_helper
 import importlib_metadata
 from importlib_metadata import (
     Distribution,
+    DistributionFinder,
     EntryPoint,
+    EntryPoints,
     MetadataNotFound,
     PackageNotFoundError,
+    PathDistribution,
     _unique,
+    distribution_for_file,
     distributions,
+    distributions_for_package,
     entry_points,
+    files,
     metadata,
     packages_distributions,
     version,
@@ -85,6 +99,180 @@ class ImportTests(fixtures.DistInfoPkg, unittest.TestCase):
         assert ep.load() is importlib_metadata
 
 
+class EntryPointsGroupTests(fixtures.DistInfoPkg, unittest.TestCase):
+    def test_group_only_parsed(self):
+        eps = entry_points(group='entries')
+        assert eps.names == {'main', 'ns:sub'}
+        assert not entry_points(group='entries', name='missing')
+
+    def test_provider_entry_points_honored(self):
+        """
+        Selection by group is honored for providers overriding
+        ``Distribution.entry_points``.
+        """
+
+        class CustomDist(Distribution):
+            def read_text(self, filename):
+                return 'Name: custom' if filename == 'METADATA' else None
+
+            def locate_file(self, path):
+                raise NotImplementedError()
+
+            @property
+            def entry_points(self):
+                eps = [
+                    EntryPoint(name='custom', value='mod:custom', group='entries'),
+                    EntryPoint(name='other', value='mod:other', group='other'),
+                ]
+                return EntryPoints(ep._for(self) for ep in eps)
+
+        class CustomFinder(DistributionFinder):
+            def find_spec(self, *args, **kwargs):
+                return None
+
+            def find_distributions(self, context=DistributionFinder.Context()):
+                return [CustomDist()] if context.name in (None, 'custom') else []
+
+        self.fixtures.enter_context(fixtures.install_finder(CustomFinder()))
+        eps = entry_points(group='entries')
+        assert eps['custom'].dist.name == 'custom'
+        assert 'other' not in eps.names
+
+
+class EntryPointsInvalidTests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        fixtures.build_files(
+            {
+                'invalid-1.0.dist-info': {
+                    'METADATA': 'Name: invalid\n',
+                    'entry_points.txt': '[entries]\nbad = invalid-name\n',
+                },
+            },
+            self.site_dir,
+        )
+
+    def test_validated_on_use(self):
+        """
+        Invalid entry points in metadata are reported on use, not discovery.
+        """
+        ep = entry_points(group='entries')['bad']
+        with self.assertRaises(ValueError):
+            ep.module
+        with self.assertRaises(ValueError):
+            ep.load()
+
+    def test_validated_on_construction(self):
+        (ep,) = Distribution.from_name('invalid').entry_points
+        with self.assertRaises(ValueError):
+            EntryPoint(name=ep.name, value=ep.value, group=ep.group)
+
+    def test_validate(self):
+        """
+        Entry points from metadata may be validated eagerly.
+        """
+        eps = Distribution.from_name('invalid').entry_points
+        with self.assertRaises(ValueError):
+            eps.validate()
+        fixtures.build_files(
+            {
+                'valid-1.0.dist-info': {
+                    'METADATA': 'Name: valid\n',
+                    'entry_points.txt': '[entries]\ngood = mod:attr [extra]\n',
+                },
+            },
+            self.site_dir,
+        )
+        valid = Distribution.from_name('valid').entry_points
+        assert valid.validate() is valid
+
+
+class EntryPointsCacheTests(fixtures.DistInfoPkg, unittest.TestCase):
+    def test_same_object(self):
+        assert entry_points() is entry_points()
+        assert entry_points(group='entries') is entry_points(group='entries')
+
+    def test_new_distribution(self):
+        before = entry_points(group='entries')
+        fixtures.build_files(
+            {
+                'other-1.0.dist-info': {
+                    'METADATA': 'Name: other\n',
+                    'entry_points.txt': '[entries]\nother = mod:other\n',
+                },
+            },
+            self.site_dir,
+        )
+        os.utime(self.site_dir, ns=(0, 0))
+        after = entry_points(group='entries')
+        assert after is not before
+        assert 'other' in after.names
+
+    def test_invalidate_caches(self):
+        before = entry_points()
+        info = self.site_dir / 'distinfo_pkg-1.0.0.dist-info'
+        info.joinpath('entry_points.txt').write_text(
+            '[entries]\nrenamed = mod:main\n', encoding='utf-8'
+        )
+        assert entry_points() is before
+        importlib.invalidate_caches()
+        assert 'renamed' in entry_points(group='entries').names
+
+    def test_path_entry_replaced(self):
+        """
+        Replacing a sys.path entry with another of equal mtime (as
+        where mtimes are normalized) is detected.
+        """
+        other = self.fixtures.enter_context(fixtures.tmp_path())
+        fixtures.build_files(
+            {
+                'other-1.0.dist-info': {
+                    'METADATA': 'Name: other\n',
+                    'entry_points.txt': '[entries]\nother = mod:other\n',
+                },
+            },
+            other,
+        )
+        for path in (self.site_dir, other):
+            os.utime(path, ns=(1, 1))
+        assert 'other' not in entry_points(group='entries').names
+        index = sys.path.index(str(self.site_dir))
+        sys.path[index] = str(other)
+        self.addCleanup(sys.path.__setitem__, index, str(self.site_dir))
+        assert 'other' in entry_points(group='entries').names
+
+
+class DistributionForFileTests(
+    fixtures.EggInfoPkg, fixtures.DistInfoPkg, unittest.TestCase
+):
+    def test_owner(self):
+        top_level = self.site_dir / 'egginfo_pkg.egg-info' / 'top_level.txt'
+        assert distribution_for_file(top_level).name == 'egginfo-pkg'
+        assert distribution_for_file(str(top_level)).name == 'egginfo-pkg'
+
+    def test_unnormalized(self):
+        path = os.path.join(self.site_dir, 'pkg', '..', 'mod.py')
+        assert distribution_for_file(path).name in ('distinfo-pkg', 'egginfo-pkg')
+
+    def test_missing(self):
+        assert distribution_for_file(self.site_dir / 'unknown.py') is None
+
+    def test_new_distribution(self):
+        assert distribution_for_file(self.site_dir / 'other.py') is None
+        fixtures.build_files(
+            {
+                'other.py': '',
+                'other-1.0.dist-info': {
+                    'METADATA': 'Name: other\n',
+                    'RECORD': 'other.py,,\n',
+                },
+            },
+            self.site_dir,
+        )
+        os.utime(self.site_dir, ns=(0, 0))
+        assert distribution_for_file(self.site_dir / 'other.py').name == 'other'
+
+
 class NameNormalizationTests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
     @staticmethod
     def make_pkg(name):
@@ -212,6 +400,59 @@ class NonASCIITests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
         assert meta['Description'] == 'pôrˈtend'
 
 
+class MetadataBytesTests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
+    def test_line_endings(self):
+        """
+        Metadata read as bytes honors line endings as read_text would.
+        """
+        contents = {
+            'portend.dist-info': {
+                'METADATA': b'Name: portend\r\nLicense: blah\r\n        de-blah\r\n'
+                b'\r\np\xc3\xb4rtend\r\n\r\nend\r',
+            },
+        }
+        fixtures.build_files(contents, self.site_dir)
+        meta = metadata('portend')
+        assert meta['License'] == 'blah\nde-blah'
+        assert meta['Description'] == 'p\xf4rtend\n\nend\n'
+
+    def test_read_bytes_default(self):
+        """
+        Providers implementing only read_text supply bytes as UTF-8.
+        """
+
+        class TextOnly(Distribution):
+            def read_text(self, filename):
+                return 'Name: portend\n\npôrˈtend' if filename == 'METADATA' else None
+
+            def locate_file(self, path):
+                raise NotImplementedError()
+
+        dist = TextOnly()
+        assert dist.read_bytes('METADATA').decode('utf-8').endswith('pôrˈtend')
+        assert dist.read_bytes('RECORD') is None
+        assert dist.metadata['Description'] == 'pôrˈtend'
+
+    def test_read_text_overridden(self):
+        """
+        A PathDistribution subclass overriding read_text supplies the
+        metadata, not the file on disk.
+        """
+        contents = {
+            'foo-1.0.dist-info': {'METADATA': 'Name: foo\nVersion: 1.0\n'},
+        }
+        fixtures.build_files(contents, self.site_dir)
+
+        class Overridden(PathDistribution):
+            def read_text(self, filename):
+                if filename == 'METADATA':
+                    return 'Name: overridden\nVersion: 9.9\n'
+                return super().read_text(filename)
+
+        dist = Overridden(self.site_dir / 'foo-1.0.dist-info')
+        assert (dist.name, dist.version) == ('overridden', '9.9')
+
+
 class DiscoveryTests(
     fixtures.EggInfoPkg,
     fixtures.EggInfoPkgPipInstalledNoToplevel,
@@ -302,6 +543,47 @@ class TestEntryPoints(unittest.TestCase):
         revived = pickle.loads(pickle.dumps(self.ep))
         assert revived == self.ep
 
+    def test_pickle_retains_dist(self):
+        dist = importlib_metadata.PathDistribution(pathlib.Path('/pkg.dist-info'))
+        revived = pickle.loads(pickle.dumps(self.ep._for(dist)))
+        assert revived.dist._path == dist._path
+        assert hash(revived) == hash(self.ep)
+
+    def test_unpickle_instance_dict(self):
+        """
+        An EntryPoint pickled with its instance dict, as by earlier
+        versions, including a cached match, can be unpickled.
+        """
+        state = dict(
+            name='name',
+            value='mod:attr',
+            group='group',
+            _match=types.SimpleNamespace(module='mod', attr='attr', extras=None),
+        )
+
+        class Earlier:
+            def __reduce__(self):
+                return copyreg._reconstructor, (EntryPoint, object, None), state
+
+        revived = pickle.loads(pickle.dumps(Earlier()))
+        assert revived == EntryPoint(name='name', value='mod:attr', group='group')
+        assert revived.dist is None
+        assert revived.attr == 'attr'
+
+    def test_slotted(self):
+        """
+        EntryPoint has no instance dict and shares group strings.
+        """
+        assert not hasattr(self.ep, '__dict__')
+        other = EntryPoint(name='other', value='value', group=''.join(['gr', 'oup']))
+        assert other.group is self.ep.group
+
+    def test_eq_hash(self):
+        same = EntryPoint(name='name', value='value', group='group')
+        assert same == self.ep
+        assert hash(same) == hash(self.ep)
+        assert self.ep != EntryPoint(name='name', value='other', group='group')
+
     def test_positional_args(self):
         """
         Capture legacy (namedtuple) construction, discouraged.
@@ -338,6 +620,205 @@ class TestEntryPoints(unittest.TestCase):
         ])
 
 
+class EntryPointScanTests(unittest.TestCase):
+    """
+    The scanner agrees with ``EntryPoint.pattern``.
+    """
+
+    samples = [
+        'mod',
+        'pkg.mod:obj.attr',
+        'pkg.mod : attr [extra1, extra2]',
+        ' mod',
+        'mod:',
+        'mod:attr:other',
+        'mod:a b',
+        'mod [x] :attr',
+        'mod [x',
+        'mod [x]\n',
+        'mod [x\n]',
+        'mod\n:attr',
+        'mod[]',
+        'mod [a] [b] ',
+        'mod [a:b]',
+        '._:_.',
+        'm\u00f6d:\u0101ttr',
+        'mod\u00a0:attr\u2003',
+        'mod-name:attr',
+        '0' + ' ' * 100 + '0',
+        '',
+    ]
+
+    alphabet = 'aaabb_.:[] \t\n,-\u00e9\u00a0'
+
+    def check(self, value):
+        match = EntryPoint.pattern.match(value)
+        scanned = importlib_metadata._EntryPointMatch.scan(value)
+        if not match:
+            assert scanned is None, value
+            return
+        assert vars(scanned) == dict(
+            match.groupdict(),
+            names=re.findall(r'\w+', match.group('extras') or ''),
+        ), value
+
+    def test_samples(self):
+        for value in self.samples:
+            self.check(value)
+
+    def test_generated(self):
+        rand = random.Random(0)
+        for _ in range(5000):
+            self.check(''.join(rand.choices(self.alphabet, k=rand.randrange(12))))
+
+    def test_errors(self):
+        for value in ('mod:', 'mod [x', ' mod'):
+            with self.assertRaises(ValueError) as ctx:
+                EntryPoint(name='n', value=value, group='g')
+            assert ctx.exception.args[1] == value
+
+
+class TestEntryPointsSelect(unittest.TestCase):
+    def setUp(self):
+        self.eps = EntryPoints([
+            EntryPoint(name='a', value='mod:a', group='g1'),
+            EntryPoint(name='b', value='mod:b', group='g2'),
+            EntryPoint(name='a', value='mod:a2', group='g2'),
+            EntryPoint(name='c', value='other', group='g1'),
+        ])
+
+    def scan(self, **params):
+        return tuple(ep for ep in self.eps if ep.matches(**params))
+
+    @fixtures.parameterize(
+        dict(params=dict(group='g1')),
+        dict(params=dict(group='g2', name='a')),
+        dict(params=dict(name='a')),
+        dict(params=dict(group='missing')),
+        dict(params=dict(group='g1', module='other')),
+        dict(params=dict(group=['g1'])),
+        dict(params=dict()),
+    )
+    def test_select_matches_scan(self, params):
+        assert self.eps.select(**params) == self.scan(**params)
+
+    def test_getitem_first(self):
+        assert self.eps['a'].value == 'mod:a'
+        with self.assertRaises(KeyError):
+            self.eps['missing']
+
+    def test_select_dist_disallowed(self):
+        with self.assertRaises(ValueError):
+            self.eps.select(group='g1', dist='foo')
+
+    def test_pickleable(self):
+        self.eps.select(group='g1')
+        revived = pickle.loads(pickle.dumps(self.eps))
+        assert revived == self.eps
+        assert revived.groups == {'g1', 'g2'}
+
+
+class SectionedTests(unittest.TestCase):
+    text = (
+        'ignored = before any section\n'
+        '[ group ]\n'
+        '  spaced  =  mod : attr [ extra ]  \n'
+        '#comment = skipped\n'
+        'nested = a=b\n'
+        '\n'
+        '[other]\n'
+        'x=y\n'
+    )
+
+    def test_entries_match_section_pairs(self):
+        expected = [
+            (item.name, item.value.name, item.value.value)
+            for item in importlib_metadata.Sectioned.section_pairs(self.text)
+        ]
+        assert list(importlib_metadata.Sectioned.entries(self.text)) == expected
+
+    def test_entries_malformed(self):
+        with self.assertRaises(TypeError):
+            list(importlib_metadata.Sectioned.entries('[group]\nno-equals\n'))
+
+
+class TestEntryPointsLoadAll(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        fixtures.build_files(
+            {
+                'loadall_pkg': {
+                    '__init__.py': '',
+                    'first.py': 'value = 1',
+                    'second.py': 'value = 2',
+                },
+                'loadall_other.py': 'value = 3',
+            },
+            self.site_dir,
+        )
+        self.fixtures.callback(self.unload)
+        self.eps = EntryPoints([
+            EntryPoint(name='first', value='loadall_pkg.first:value', group='g'),
+            EntryPoint(name='other', value='loadall_other:value', group='g'),
+            EntryPoint(name='second', value='loadall_pkg.second:value', group='g'),
+        ])
+
+    @staticmethod
+    def unload():
+        for name in list(sys.modules):
+            if name.startswith('loadall_'):
+                del sys.modules[name]
+
+    def test_values_and_modules(self):
+        results = self.eps.load_all()
+        assert [result.value for result in results] == [1, 3, 2]
+        assert [result.modules for result in results] == [2, 1, 1]
+        assert all(result.elapsed >= 0 for result in results)
+
+    def test_by_package(self):
+        results = self.eps.load_all(by_package=True)
+        assert [result.entry_point.name for result in results] == [
+            'first',
+            'other',
+            'second',
+        ]
+        assert [result.modules for result in results] == [2, 1, 1]
+
+    def test_fail_fast(self):
+        eps = EntryPoints([
+            EntryPoint(name='missing', value='loadall_missing', group='g'),
+            *self.eps,
+        ])
+        with self.assertRaises(ImportError):
+            eps.load_all()
+        assert 'loadall_pkg' not in sys.modules
+
+    def test_collect_errors(self):
+        eps = EntryPoints([
+            EntryPoint._lazy(name='invalid', value='not valid!', group='g'),
+            *self.eps,
+        ])
+        invalid, *rest = eps.load_all(collect_errors=True)
+        assert isinstance(invalid.error, ValueError)
+        assert invalid.value is None
+        assert [result.value for result in rest] == [1, 3, 2]
+
+    def test_equal_entry_points(self):
+        """
+        Equal entry points from different distributions each get their
+        own result.
+        """
+        dists = [object(), object()]
+        value = 'loadall_pkg.first:value'
+        eps = EntryPoints(
+            EntryPoint(name='first', value=value, group='g')._for(dist)
+            for dist in dists
+        )
+        for by_package in (False, True):
+            results = eps.load_all(by_package=by_package)
+            assert [result.entry_point.dist for result in results] == dists
+
+
 class FileSystem(
     fixtures.OnSysPath, fixtures.SiteDir, fixtures.FileBuilder, unittest.TestCase
 ):
@@ -353,6 +834,144 @@ class FileSystem(
         list(distributions())
 
 
+class ResolveAllTests(fixtures.SiteDir, unittest.TestCase):
+    """
+    Names resolve as they would with ``Path.resolve``.
+    """
+
+    @os_helper.skip_unless_symlink
+    def test_resolve_all(self):
+        fixtures.build_files(
+            {
+                'pkg': {'mod.py': '', 'sub': {'leaf.py': ''}},
+                'linked': Symlink('pkg'),
+                'pkg.egg-info': {'link.py': Symlink('../pkg/mod.py')},
+            },
+            self.site_dir,
+        )
+        base = self.site_dir / 'pkg.egg-info'
+        names = [
+            '../pkg/mod.py',
+            '../linked/mod.py',
+            '../linked/sub/../mod.py',
+            '../pkg/./sub//leaf.py',
+            'link.py',
+            'PKG-INFO',
+            '../../outside.txt',
+            '/absolute/file.txt',
+            '..',
+            '',
+        ]
+        expected = [str((base / name).resolve()) for name in names]
+        assert list(importlib_metadata._resolve_all(base, names)) == expected
+
+
+class InstalledSizeTests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        files = {
+            'sized': {'recorded.py': 'x' * 10, 'unrecorded.pyc': 'x' * 7},
+            'sized-1.0.dist-info': {
+                'METADATA': 'Name: sized\nVersion: 1.0\n',
+                'RECORD': (
+                    'sized/recorded.py,sha256=abc,100\n'
+                    'sized/unrecorded.pyc,,\n'
+                    'sized/missing.pyc,,\n'
+                ),
+            },
+            'unlisted-1.0.dist-info': {'METADATA': 'Name: unlisted\n'},
+        }
+        fixtures.build_files(files, self.site_dir)
+
+    def test_installed_size(self):
+        """
+        Recorded sizes are trusted; others are checked.
+        """
+        assert importlib_metadata.distribution('sized').installed_size() == 107
+        assert importlib_metadata.distribution('unlisted').installed_size() is None
+
+    def test_installed_sizes(self):
+        sizes = importlib_metadata.installed_sizes(max_workers=2)
+        assert sizes['sized'] == 107
+        assert sizes['unlisted'] is None
+
+
+class RecordRowsTests(unittest.TestCase):
+    """
+    The RECORD tokenizer agrees with ``csv``.
+    """
+
+    def test_generated(self):
+        rand = random.Random(0)
+        for _ in range(5000):
+            lines = [
+                ''.join(rand.choices('ab," ', k=rand.randrange(6)))
+                for _ in range(rand.randrange(1, 4))
+            ]
+            expected = list(csv.reader(lines))
+            assert list(importlib_metadata._record_rows(lines)) == expected, lines
+
+
+class FilesExistTests(fixtures.OnSysPath, fixtures.SiteDir, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        record = [
+            'present.py',
+            'missing.py',
+            'pkg/present.py',
+            'pkg/missing.py',
+            'gone/missing.py',
+            'linked.py',
+            'broken.py',
+        ]
+        files = {
+            'present.py': '',
+            'pkg': {'present.py': ''},
+            'files_exist-1.0.dist-info': {
+                'METADATA': 'Name: files-exist\nVersion: 1.0\n',
+                'RECORD': ''.join(f'{name},,\n' for name in record),
+            },
+        }
+        fixtures.build_files(files, self.site_dir)
+
+    def names(self, **kwargs):
+        return sorted(path.as_posix() for path in files('files-exist', **kwargs))
+
+    @os_helper.skip_unless_symlink
+    def test_symlinks(self):
+        fixtures.build_files(
+            {'linked.py': Symlink('present.py'), 'broken.py': Symlink('nowhere.py')},
+            self.site_dir,
+        )
+        assert self.names() == ['linked.py', 'pkg/present.py', 'present.py']
+
+    def test_check_exists(self):
+        assert self.names() == ['pkg/present.py', 'present.py']
+
+    def test_no_check_exists(self):
+        assert len(self.names(check_exists=False)) == 7
+
+    def test_iter_files(self):
+        dist = importlib_metadata.distribution('files-exist')
+        found = dist.iter_files()
+        first = next(found)
+        assert first == files('files-exist')[0] and first.dist is dist
+        assert len(list(found)) == 6
+        by_suffix = [path.as_posix() for path in dist.iter_files(suffix='missing.py')]
+        assert by_suffix == ['missing.py', 'pkg/missing.py', 'gone/missing.py']
+        in_pkg = [path.as_posix() for path in dist.iter_files(top_level='pkg')]
+        assert in_pkg == ['pkg/present.py', 'pkg/missing.py']
+
+    def test_file_table(self):
+        table = importlib_metadata.distribution('files-exist').file_table
+        assert len(table) == 7
+        assert table.paths()[2] == 'pkg/present.py'
+        assert table[2] == files('files-exist', check_exists=False)[2]
+        assert table[2].dist.name == 'files-exist'
+        assert table.dirs == ['', 'pkg/', 'gone/']
+        assert table[-1].hash is None and table[-1].size is None
+
+
 class PackagesDistributionsPrebuiltTest(fixtures.ZipFixtures, unittest.TestCase):
     def test_packages_distributions_example(self):
         self._fixture_on_path('example-21.12-py3-none-any.whl')
@@ -424,6 +1043,61 @@ class PackagesDistributionsTest(
 
         assert not any(name.endswith('.dist-info') for name in distributions)
 
+    def test_packages_distributions_incremental(self):
+        """
+        Only distributions added or reinstalled are read again.
+        """
+        fixtures.build_files(
+            {
+                'cached-1.0.dist-info': {
+                    'METADATA': 'Name: cached\n',
+                    'RECORD': 'cached.py,,\n',
+                    'top_level.txt': 'cached\n',
+                },
+            },
+            self.site_dir,
+        )
+        before = packages_distributions()
+        before['cached'].append('mutated')
+        info = self.site_dir / 'cached-1.0.dist-info'
+        stamp = (info / 'RECORD').stat().st_mtime_ns
+        (info / 'top_level.txt').write_text('renamed\n', encoding='utf-8')
+        os.utime(info / 'RECORD', ns=(stamp, stamp))
+        fixtures.build_files(
+            {
+                'added.py': '',
+                'added-1.0.dist-info': {
+                    'METADATA': 'Name: added\n',
+                    'RECORD': 'added.py,,\n',
+                },
+            },
+            self.site_dir,
+        )
+        os.utime(self.site_dir, ns=(0, 0))
+        after = packages_distributions()
+        assert after['cached'] == ['cached']
+        assert after['added'] == ['added']
+        os.utime(info / 'RECORD', ns=(0, 0))
+        os.utime(self.site_dir, ns=(1, 1))
+        assert 'cached' not in packages_distributions()
+        assert packages_distributions()['renamed'] == ['cached']
+
+    def test_packages_distributions_uninstalled(self):
+        """
+        Values for uninstalled distributions are not retained.
+        """
+        fixtures.build_files(
+            {'gone-1.0.dist-info': {'METADATA': 'Name: gone\n', 'RECORD': ''}},
+            self.site_dir,
+        )
+        info = self.site_dir / 'gone-1.0.dist-info'
+        packages_distributions()
+        assert info in importlib_metadata._dist_packages
+        shutil.rmtree(info)
+        os.utime(self.site_dir, ns=(0, 0))
+        packages_distributions()
+        assert info not in importlib_metadata._dist_packages
+
     @os_helper.skip_unless_symlink
     def test_packages_distributions_symlinked_top_level(self) -> None:
         """
@@ -483,6 +1157,23 @@ class PackagesDistributionsEggTest(
         # SOURCES.txt (top_level.txt and installed-files.txt is missing)
         assert import_names_from_package('sources_fallback-pkg') == {'sources_fallback'}
 
+    def test_packages_distributions_parallel(self):
+        """
+        The mapping is the same, in the same order, computed in parallel.
+        """
+        serial = packages_distributions()
+        importlib.invalidate_caches()
+        parallel = packages_distributions(max_workers=4)
+        assert list(parallel.items()) == list(serial.items())
+
+    def test_distributions_for_package(self):
+        """
+        Each package resolves as in the full mapping.
+        """
+        for name, dists in packages_distributions().items():
+            assert distributions_for_package(name) == dists, name
+        assert distributions_for_package('missing') == []
+
 
 class EditableDistributionTest(fixtures.DistInfoPkgEditable, unittest.TestCase):
     def test_origin(self):
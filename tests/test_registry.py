@@ -0,0 +1,82 @@
+import importlib
+import json
+import os
+import unittest
+
+from importlib_metadata import entry_points, registry
+
+from . import fixtures
+
+
+class RegistryTests(fixtures.EggInfoPkg, fixtures.DistInfoPkg, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        registry.save(self.site_dir)
+        self.info = self.site_dir / 'distinfo_pkg-1.0.0.dist-info'
+        self.rewrite(self.info / 'entry_points.txt', keep_stamp=True)
+        importlib.invalidate_caches()
+        self.fixtures.callback(importlib.invalidate_caches)
+
+    @staticmethod
+    def rewrite(file, keep_stamp=False):
+        stamp = file.stat().st_mtime_ns
+        file.write_text('[entries]\nmain = changed:main\n', encoding='utf-8')
+        os.utime(file, ns=(stamp, stamp) if keep_stamp else (0, 0))
+
+    def values(self):
+        return sorted(ep.value for ep in entry_points(group='entries'))
+
+    def test_registry_used(self):
+        assert (self.site_dir / registry.NAME).exists()
+        assert self.values() == ['mod:main', 'mod:main', 'mod:main']
+
+    def test_stale_distribution(self):
+        os.utime(self.info / 'entry_points.txt', ns=(0, 0))
+        importlib.invalidate_caches()
+        assert self.values() == ['changed:main', 'mod:main']
+
+    def test_unregistered_distribution(self):
+        fixtures.build_files(
+            {
+                'other-1.0.dist-info': {
+                    'METADATA': 'Name: other\nVersion: 1.0\n',
+                    'entry_points.txt': '[entries]\nother = other:main\n',
+                },
+            },
+            self.site_dir,
+        )
+        importlib.invalidate_caches()
+        assert self.values() == ['mod:main', 'mod:main', 'mod:main', 'other:main']
+
+    def test_corrupt_registry(self):
+        (self.site_dir / registry.NAME).write_text('{', encoding='utf-8')
+        importlib.invalidate_caches()
+        assert self.values() == ['changed:main', 'mod:main']
+
+    def test_rewritten_in_place(self):
+        """
+        An egg-info whose entry_points.txt is rewritten in place, which
+        leaves the directory unchanged, is not served stale.
+        """
+        info = self.site_dir / 'egginfo_pkg.egg-info'
+        stamp = info.stat().st_mtime_ns
+        self.rewrite(info / 'entry_points.txt')
+        assert info.stat().st_mtime_ns == stamp
+        importlib.invalidate_caches()
+        assert self.values() == ['changed:main', 'mod:main', 'mod:main']
+
+    def test_malformed_registry(self):
+        malformed = [
+            [],
+            {'format': 1},
+            {'format': 1, 'distributions': []},
+            {'format': 1, 'distributions': {'distinfo_pkg-1.0.0.dist-info': {}}},
+            {'format': 1, 'distributions': {'distinfo_pkg-1.0.0.dist-info': []}},
+        ]
+        for data in malformed:
+            with self.subTest(data=data):
+                (self.site_dir / registry.NAME).write_text(
+                    json.dumps(data), encoding='utf-8'
+                )
+                importlib.invalidate_caches()
+                assert self.values() == ['changed:main', 'mod:main']
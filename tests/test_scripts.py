@@ -0,0 +1,84 @@
+import json
+import os
+import unittest
+
+from importlib_metadata import scripts
+
+from . import fixtures
+
+
+class ScriptsTests(fixtures.SiteBuilder, unittest.TestCase):
+    files: fixtures.FilesSpec = {
+        'scripted-1.0.dist-info': {
+            'METADATA': 'Name: scripted\nVersion: 1.0\n',
+            'entry_points.txt': (
+                '[console_scripts]\n'
+                'scripted = scripted.cli:main\n'
+                '[gui_scripts]\n'
+                'scripted-gui = scripted.gui:main\n'
+            ),
+        },
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.cache = self.fixtures.enter_context(fixtures.tmp_path()) / 'scripts.json'
+        self.path = [str(self.site_dir)]
+
+    def resolve(self, name, **kwargs):
+        return scripts.resolve(name, self.cache, path=self.path, **kwargs)
+
+    def test_resolve(self):
+        ep = self.resolve('scripted')
+        assert ep.value == 'scripted.cli:main'
+        assert ep.group == 'console_scripts'
+        assert ep.dist.version == '1.0'
+        assert self.cache.exists()
+
+    def test_gui(self):
+        assert self.resolve('scripted-gui', group='gui_scripts').attr == 'main'
+        assert self.resolve('scripted-gui') is None
+
+    def test_missing(self):
+        assert self.resolve('missing') is None
+
+    def test_answers_from_table(self):
+        self.resolve('scripted')
+        (self.site_dir / 'scripted-1.0.dist-info' / 'entry_points.txt').unlink()
+        assert self.resolve('scripted').value == 'scripted.cli:main'
+
+    def test_stale_table_rebuilt(self):
+        self.resolve('scripted')
+        fixtures.build_files(
+            {
+                'other-2.0.dist-info': {
+                    'METADATA': 'Name: other\nVersion: 2.0\n',
+                    'entry_points.txt': '[console_scripts]\nother = other:main\n',
+                },
+            },
+            self.site_dir,
+        )
+        os.utime(self.site_dir, ns=(0, 0))
+        assert self.resolve('other').value == 'other:main'
+
+    def test_corrupt_table_rebuilt(self):
+        self.cache.write_text('not json', encoding='utf-8')
+        assert self.resolve('scripted').value == 'scripted.cli:main'
+
+    def test_malformed_table_rebuilt(self):
+        stamps = [[item, os.stat(item).st_mtime_ns] for item in self.path]
+        tables = [
+            [],
+            {'format': 1, 'stamps': stamps},
+            {'format': 1, 'stamps': stamps, 'groups': []},
+            {'format': 1, 'stamps': stamps, 'groups': {'console_scripts': []}},
+            {
+                'format': 1,
+                'stamps': stamps,
+                'groups': {'console_scripts': {'scripted': 'scripted.cli:main'}},
+            },
+        ]
+        for table in tables:
+            with self.subTest(table=table):
+                self.cache.write_text(json.dumps(table), encoding='utf-8')
+                assert self.resolve('scripted').value == 'scripted.cli:main'
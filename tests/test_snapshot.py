@@ -0,0 +1,86 @@
+import os
+import unittest
+
+from importlib_metadata import (
+    Distribution,
+    DistributionFinder,
+    PackageNotFoundError,
+    entry_points,
+    files,
+    requires,
+    snapshot,
+    version,
+)
+
+from . import fixtures
+
+
+class SnapshotTests(fixtures.SiteBuilder, unittest.TestCase):
+    """
+    Packages are built off of sys.path, so are found only through
+    the snapshot.
+    """
+
+    files: fixtures.FilesSpec = {
+        **fixtures.DistInfoPkg.files,
+        **fixtures.EggInfoPkg.files,
+        **fixtures.EggInfoPkgPipInstalledNoToplevel.files,
+        **fixtures.EggInfoFile.files,
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.snapshot = self.fixtures.enter_context(fixtures.tmp_path()) / 'env.json'
+        snapshot.save(self.snapshot, Distribution.discover(path=[str(self.site_dir)]))
+        self.finder = snapshot.load(self.snapshot)
+        self.fixtures.enter_context(fixtures.install_finder(self.finder))
+
+    def test_names(self):
+        assert {dist.name for dist in self.finder.find_distributions()} == {
+            'distinfo-pkg',
+            'egginfo-pkg',
+            'egg_with_module-pkg',
+            'egginfo_file',
+        }
+
+    def test_metadata(self):
+        assert version('distinfo-pkg') == '1.0.0'
+        assert version('egginfo-file') == '0.1'
+        assert requires('egginfo-pkg') == [
+            'wheel >= 1.0; python_version >= "2.7"',
+            'pytest; extra == "test"',
+        ]
+        assert entry_points(group='entries')['main'].value == 'mod:main'
+
+    def test_files(self):
+        (mod,) = files('distinfo-pkg')
+        assert mod.hash.value == 'abc'
+        assert mod.size == 20
+        assert mod.locate().exists()
+        assert 'egg_with_module.py' in map(str, files('egg_with_module-pkg'))
+
+    def test_missing_distribution(self):
+        with self.assertRaises(PackageNotFoundError):
+            version('does-not-exist')
+
+    def test_path_honored(self):
+        elsewhere = DistributionFinder.Context(path=['/elsewhere'])
+        assert not list(self.finder.find_distributions(elsewhere))
+        here = DistributionFinder.Context(path=[str(self.site_dir)])
+        assert len(list(self.finder.find_distributions(here))) == 4
+
+    def test_path_spellings(self):
+        """
+        Other spellings of the same directory match the snapshot.
+        """
+        link = self.fixtures.enter_context(fixtures.tmp_path()) / 'site'
+        link.symlink_to(self.site_dir)
+        spellings = [
+            f'{self.site_dir}{os.sep}',
+            os.path.join(self.site_dir, '.'),
+            os.path.relpath(self.site_dir),
+            str(link),
+        ]
+        for spelling in spellings:
+            context = DistributionFinder.Context(path=[spelling])
+            assert len(list(self.finder.find_distributions(context))) == 4
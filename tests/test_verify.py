@@ -0,0 +1,86 @@
+import base64
+import hashlib
+import unittest
+from unittest import mock
+
+from importlib_metadata import Distribution, distribution, verify
+
+from . import fixtures
+
+
+def record_hash(data):
+    digest = hashlib.sha256(data).digest()
+    return 'sha256=' + base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
+
+
+good = b'print("good")\n'
+
+
+class VerifyTests(fixtures.OnSysPath, fixtures.SiteBuilder, unittest.TestCase):
+    files: fixtures.FilesSpec = {
+        'verified-1.0.dist-info': {
+            'METADATA': 'Name: verified\nVersion: 1.0\n',
+            'RECORD': '\n'.join([
+                f'verified/good.py,{record_hash(good)},{len(good)}',
+                f'verified/altered.py,{record_hash(good)},{len(good)}',
+                f'verified/resized.py,{record_hash(good)},{len(good)}',
+                f'verified/missing.py,{record_hash(good)},{len(good)}',
+                'verified/odd.py,nope=abc,',
+                'verified/unhashed.pyc,,',
+                f'verified/looped.py,{record_hash(good)},{len(good)}',
+                'verified-1.0.dist-info/RECORD,,',
+            ]),
+        },
+        'verified': {
+            'good.py': good.decode(),
+            'altered.py': good.decode().replace('good', 'evil'),
+            'resized.py': 'print("bigger")\n',
+            'odd.py': '',
+            'unhashed.pyc': '',
+        },
+    }
+
+    def setUp(self):
+        super().setUp()
+        looped = self.site_dir / 'verified' / 'looped.py'
+        looped.symlink_to(looped)
+
+    def test_verify(self):
+        problems = distribution('verified').verify(max_workers=2)
+        assert [(str(problem.path), problem.kind) for problem in problems] == [
+            ('verified/altered.py', 'hash'),
+            ('verified/looped.py', 'unreadable'),
+            ('verified/missing.py', 'missing'),
+            ('verified/odd.py', 'unsupported'),
+            ('verified/resized.py', 'size'),
+        ]
+        altered = problems[0]
+        assert altered.expected == record_hash(good).partition('=')[2]
+        assert altered.actual != altered.expected
+
+    def test_progress(self):
+        calls = []
+        verify.verify_distribution(
+            distribution('verified'), progress=lambda *args: calls.append(args)
+        )
+        assert calls[-1] == (8, 8)
+        assert [done for done, total in calls] == list(range(1, 9))
+
+    def test_pending_bounded(self):
+        """
+        Files are listed as checks complete, not all up front.
+        """
+        self.fixtures.enter_context(mock.patch.object(verify, '_PENDING', 2))
+        calls = []
+        problems = verify.verify_distribution(
+            distribution('verified'), progress=lambda *args: calls.append(args)
+        )
+        assert len(problems) == 5
+        assert all(listed - done < 2 for done, listed in calls)
+        assert calls[-1] == (8, 8)
+
+    def test_environment(self):
+        dists = list(Distribution.discover(path=[str(self.site_dir)]))
+        results = verify.verify_environment(dists)
+        assert list(results) == dists
+        assert len(results[dists[0]]) == 5